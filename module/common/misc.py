@@ -92,6 +92,35 @@ def grab(structure=None, path=None, separator=".", fallback=None):
     return traverse(structure, path)
 
 
+def direct_grab(structure, *attributes, fallback=None):
+    """
+    get data from an object by walking a chain of attribute names with
+    plain getattr calls. A lightweight companion to 'grab' for hot code
+    paths where the structure is known to be attribute based (i.e. pyVmomi
+    data objects) and no dict/list path handling is needed.
+
+    Parameters
+    ----------
+    structure: object
+        an object structure to extract data from
+    attributes: str
+        attribute names to walk in order
+    fallback: dict, list, str, int
+        data to return if an attribute along the path is missing or None
+
+    Returns
+    -------
+    object: the desired attribute value if found, otherwise fallback
+    """
+
+    for attribute in attributes:
+        structure = getattr(structure, attribute, None)
+        if structure is None:
+            return fallback
+
+    return structure
+
+
 def dump(obj):
     """
     Dump content of a object to stdout
@@ -8,6 +8,7 @@
 #  repository or visit: <https://opensource.org/licenses/MIT>.
 
 import asyncio
+from functools import lru_cache
 
 import aiodns
 
@@ -16,6 +17,22 @@ from module.common.logging import get_logger
 log = get_logger()
 
 
+@lru_cache(maxsize=65536)
+def _normalize_mac_address_cached(mac_address):
+    """
+    cached part of 'normalize_mac_address', the same MAC addresses are
+    normalized over and over again during a sync run
+    """
+
+    mac_address = mac_address.upper()
+
+    # add colons to interface address
+    if ":" not in mac_address:
+        mac_address = ':'.join(mac_address[i:i+2] for i in range(0, len(mac_address), 2))
+
+    return mac_address
+
+
 def normalize_mac_address(mac_address=None):
     """
     normalize a MAC address
@@ -35,13 +52,7 @@ def normalize_mac_address(mac_address=None):
     if mac_address is None:
         return None
 
-    mac_address = mac_address.upper()
-
-    # add colons to interface address
-    if ":" not in mac_address:
-        mac_address = ':'.join(mac_address[i:i+2] for i in range(0, len(mac_address), 2))
-
-    return mac_address
+    return _normalize_mac_address_cached(mac_address)
 
 
 def perform_ptr_lookups(ips, dns_servers=None):
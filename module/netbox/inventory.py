@@ -43,6 +43,19 @@ class NetBoxInventory:
 
             self.base_structure[object_type.name] = list()
 
+        # cache of device/VM to interface assignments, rebuilt whenever
+        # interfaces were added and flushed via 'flush_object_interfaces_cache'
+        # whenever an interface was reassigned to a different device/VM
+        self._object_interfaces_cache = dict()
+
+        # lazily built slug and display name lookup tables used by 'get_by_data',
+        # kept up to date by 'add_object' and flushed via 'flush_lookup_cache'
+        self._object_lookup_cache = dict()
+
+        # lazily built MAC address to interface lookup tables, rebuilt whenever
+        # interfaces were added or a MAC address of an interface changed
+        self._interface_mac_index = dict()
+
     def add_source(self, source_handler=None):
         """
         adds $source_tag to list of disabled sources
@@ -84,6 +97,69 @@ class NetBoxInventory:
             if this_object.nb_id == nb_id:
                 return this_object
 
+    def _get_lookup_cache(self, object_type):
+        """
+        Return the slug and display name lookup tables for $object_type used by
+        'get_by_data' and build them on first access. This avoids scanning all
+        objects of a type for every single lookup. New objects are added to the
+        tables by 'add_object', a change of a name defining attribute flushes
+        all tables via 'flush_lookup_cache'.
+
+        Parameters
+        ----------
+        object_type: NetBoxObject subclass
+            object type to return lookup tables for
+
+        Returns
+        -------
+        dict: of slug and display name lookup tables
+        """
+
+        lookup_cache = self._object_lookup_cache.get(object_type.name)
+
+        if lookup_cache is None:
+            lookup_cache = {"slug": dict(), "display_name": dict()}
+
+            for this_object in self.get_all_items(object_type):
+                self._add_object_to_lookup_cache(this_object, lookup_cache)
+
+            self._object_lookup_cache[object_type.name] = lookup_cache
+
+        return lookup_cache
+
+    @staticmethod
+    def _add_object_to_lookup_cache(this_object, lookup_cache):
+        """
+        Add $this_object to the slug and display name lookup tables in
+        $lookup_cache. The first object with a certain slug/display name wins,
+        just like the previous linear scan returned the first match.
+
+        Parameters
+        ----------
+        this_object: NetBoxObject subclass instance
+            object to add to the lookup tables
+        lookup_cache: dict
+            lookup tables of the object type of $this_object
+        """
+
+        object_slug = this_object.data.get("slug")
+        if object_slug is not None:
+            lookup_cache["slug"].setdefault(object_slug, this_object)
+
+        display_name = this_object.get_display_name(including_second_key=True)
+        if display_name is not None:
+            lookup_cache["display_name"].setdefault(f"{display_name}".lower(), this_object)
+
+    def flush_lookup_cache(self):
+        """
+        Discard all 'get_by_data' lookup tables. Called whenever a name defining
+        attribute (primary/secondary key or slug) of an object changed, as such
+        a change can also alter display names of objects referencing it. Tables
+        will be rebuilt on next lookup.
+        """
+
+        self._object_lookup_cache = dict()
+
     def get_by_data(self, object_type, data=None):
         """
         Try to find an object of $object_type which match params defined in $data
@@ -118,23 +194,15 @@ class NetBoxInventory:
         # try to find object by slug
         if "slug" in object_type.data_model.keys() and data.get("name") is not None:
             object_slug = NetBoxObject.format_slug(data.get("name"))
-            for this_object in self.get_all_items(object_type):
-                if this_object.data.get("slug") == object_slug:
-                    return this_object
+            return self._get_lookup_cache(object_type).get("slug").get(object_slug)
 
         # try to find by primary/secondary key
         elif data.get(object_type.primary_key) is not None:
-            object_name_to_find = None
-            for this_object in self.get_all_items(object_type):
-
-                if object_name_to_find is None:
-                    object_name_to_find = this_object.get_display_name(data, including_second_key=True)
+            # use an existing object of this type to format the display name of the submitted data
+            object_name_to_find = \
+                self.get_all_items(object_type)[0].get_display_name(data, including_second_key=True)
 
-                # compare lower key
-                if f"{object_name_to_find}".lower() == \
-                        f"{this_object.get_display_name(including_second_key=True)}".lower():
-
-                    return this_object
+            return self._get_lookup_cache(object_type).get("display_name").get(f"{object_name_to_find}".lower())
 
         # try to match all data attributes
         else:
@@ -205,6 +273,11 @@ class NetBoxInventory:
         # add to inventory
         self.base_structure[object_type.name].append(new_object)
 
+        # keep already built lookup tables for this object type up to date
+        lookup_cache = self._object_lookup_cache.get(object_type.name)
+        if lookup_cache is not None:
+            self._add_object_to_lookup_cache(new_object, lookup_cache)
+
         if read_from_netbox is False:
             log.info(f"Created new {new_object.name} object: {new_object.get_display_name()}")
 
@@ -295,18 +368,87 @@ class NetBoxInventory:
         if not isinstance(this_object, (NBVM, NBDevice)):
             raise ValueError(f"Object must be a '{NBVM.name}' or '{NBDevice.name}'.")
 
-        interfaces = list()
         if isinstance(this_object, NBVM):
-            for interface in self.get_all_items(NBVMInterface):
-                if grab(interface, "data.virtual_machine") == this_object:
-                    interfaces.append(interface)
+            interface_class = NBVMInterface
+            relation_key = "virtual_machine"
+        else:
+            interface_class = NBInterface
+            relation_key = "device"
+
+        all_interfaces = self.get_all_items(interface_class)
+
+        cached_num_interfaces, interface_map = \
+            self._object_interfaces_cache.get(interface_class.name, (None, None))
+
+        # build a map of object to interfaces instead of scanning all
+        # interfaces again on every call
+        if cached_num_interfaces != len(all_interfaces):
+            interface_map = dict()
+            for interface in all_interfaces:
+                assigned_object = interface.data.get(relation_key)
+                if isinstance(assigned_object, NetBoxObject):
+                    interface_map.setdefault(assigned_object, list()).append(interface)
+
+            self._object_interfaces_cache[interface_class.name] = (len(all_interfaces), interface_map)
+
+        return list(interface_map.get(this_object, list()))
+
+    def flush_object_interfaces_cache(self):
+        """
+        Discard all device/VM to interface maps. Called whenever an interface
+        was reassigned to a different device/VM. Maps will be rebuilt on next
+        lookup.
+        """
+
+        self._object_interfaces_cache = dict()
+
+    def get_interfaces_by_mac(self, interface_type, mac_address):
+        """
+        Return all interfaces of $interface_type with $mac_address. Backed by a
+        MAC address index which is built on first access instead of scanning all
+        interface objects for every single lookup. The index is rebuilt whenever
+        interfaces have been added and flushed via 'flush_interface_mac_index'
+        whenever a MAC address of an existing interface changed.
 
-        if isinstance(this_object, NBDevice):
-            for interface in self.get_all_items(NBInterface):
-                if grab(interface, "data.device") == this_object:
-                    interfaces.append(interface)
+        Parameters
+        ----------
+        interface_type: (NBInterface, NBVMInterface)
+            type of NetBox interface to look up
+        mac_address: str
+            MAC address to find interfaces for
+
+        Returns
+        -------
+        list: of all interfaces with this MAC address
+        """
+
+        if interface_type not in [NBInterface, NBVMInterface]:
+            raise ValueError(f"Object must be a '{NBInterface.name}' or '{NBVMInterface.name}'.")
+
+        all_interfaces = self.get_all_items(interface_type)
+
+        cached_num_interfaces, mac_address_index = \
+            self._interface_mac_index.get(interface_type.name, (None, None))
+
+        if cached_num_interfaces != len(all_interfaces):
+
+            mac_address_index = dict()
+            for interface in all_interfaces:
+                interface_mac = interface.data.get("mac_address")
+                if interface_mac is not None:
+                    mac_address_index.setdefault(interface_mac, list()).append(interface)
+
+            self._interface_mac_index[interface_type.name] = (len(all_interfaces), mac_address_index)
+
+        return mac_address_index.get(mac_address, list())
+
+    def flush_interface_mac_index(self):
+        """
+        Discard all MAC address lookup tables. Called whenever the MAC address
+        of an existing object changed. Tables will be rebuilt on next lookup.
+        """
 
-        return interfaces
+        self._interface_mac_index = dict()
 
     def tag_all_the_things(self, netbox_handler):
         """
@@ -129,12 +129,14 @@ class NetBoxInterfaceType:
         if not isinstance(adapter_name, str):
             return
 
+        adapter_name_lower = adapter_name.lower()
+
         detected_speed = 0
         for nic_speed in ["400", "200", "100", "50", "40", "25", "10", "5", "2.5", "1"]:
-            if f"{nic_speed}gb" in adapter_name.lower():
+            if f"{nic_speed}gb" in adapter_name_lower:
                 detected_speed = nic_speed
                 break
-            elif f"{nic_speed}gbe" in adapter_name.lower():
+            elif f"{nic_speed}gbe" in adapter_name_lower:
                 detected_speed = nic_speed
                 break
 
@@ -144,7 +146,7 @@ class NetBoxInterfaceType:
             self.detected_speed = int(detected_speed) * 1000
 
         for nic_type in ["Base-T", "QSFP-DD", "QSFP28", "QSFP56", "SFP28", "QSFP+", "QSFP", "SFP+", "SFP", "XFP"]:
-            if nic_type.lower() in adapter_name.lower():
+            if nic_type.lower() in adapter_name_lower:
                 if nic_type == "QSFP-DD":
                     nic_type = nic_type.replace("-", "")
                 elif "+" in nic_type:
@@ -536,6 +538,12 @@ class NetBoxObject:
             self.updated_items = list()
             self.unset_items = list()
 
+            # data was replaced as a whole, stored lookup tables might be stale now
+            if self.inventory is not None:
+                self.inventory.flush_lookup_cache()
+                self.inventory.flush_interface_mac_index()
+                self.inventory.flush_object_interfaces_cache()
+
             return
 
         if self.read_only is True:
@@ -661,6 +669,8 @@ class NetBoxObject:
 
         # update all data items
         data_updated = False
+        name_defining_keys = {self.primary_key, "slug", getattr(self, "secondary_key", None)}
+        name_defining_key_updated = False
         for key, new_value in parsed_data.items():
 
             # nothing changed, continue with next key
@@ -732,9 +742,27 @@ class NetBoxObject:
             self.data[key] = new_value
             self.updated_items.append(key)
             data_updated = True
+            if key in name_defining_keys:
+                name_defining_key_updated = True
+
+            # MAC address lookup tables key on this attribute and are stale now
+            if key == "mac_address" and self.inventory is not None:
+                self.inventory.flush_interface_mac_index()
 
+            # device/VM to interface maps key on this attribute and are stale now
+            if key in ("device", "virtual_machine") and self.inventory is not None:
+                self.inventory.flush_object_interfaces_cache()
+
+        # resolve relations once after all keys have been updated instead of
+        # once per changed key, unchanged data needs no resolving at all
+        if data_updated is True:
             self.resolve_relations()
 
+        # a changed primary/secondary key or slug also changes display names,
+        # stored inventory lookup tables are stale now
+        if name_defining_key_updated is True and self.inventory is not None:
+            self.inventory.flush_lookup_cache()
+
         if data_updated is True and self.is_new is False:
             log.debug("Updated %s object: %s" % (self.name, self.get_display_name()))
 
@@ -746,6 +774,26 @@ class NetBoxObject:
         if source is not None and self.source is None:
             self.source = source
 
+    def data_matches(self, data=None) -> bool:
+        """
+        check if all keys of $data are already present in this object's data
+        with equal values. Useful to skip no-op updates altogether.
+
+        Parameters
+        ----------
+        data: dict
+            dictionary with data to compare
+
+        Returns
+        -------
+        bool: True if all submitted keys match the current data
+        """
+
+        if not isinstance(data, dict):
+            return False
+
+        return all(self.data.get(key) == value for key, value in data.items())
+
     def get_display_name(self, data=None, including_second_key=False):
         """
         return a name as string of this object based on primary/secondary key
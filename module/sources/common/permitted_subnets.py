@@ -7,6 +7,8 @@
 #  For a copy, see file LICENSE.txt included in this
 #  repository or visit: <https://opensource.org/licenses/MIT>.
 
+from bisect import bisect_right
+from functools import lru_cache
 from ipaddress import ip_address, ip_network, ip_interface
 
 from module.common.logging import get_logger
@@ -14,6 +16,32 @@ from module.common.logging import get_logger
 log = get_logger()
 
 
+@lru_cache(maxsize=4096)
+def _parse_ip(ip_string: str):
+    """
+    memoized parsing of an IP address string, in interface or plain notation.
+    The same addresses get validated repeatedly within a sync run, caching
+    skips re-parsing them.
+
+    Parameters
+    ----------
+    ip_string: str
+        IP address to parse
+
+    Returns
+    -------
+    (IPv4Address, IPv6Address, None): parsed IP address, None if unparsable
+    """
+
+    try:
+        if "/" in ip_string:
+            return ip_interface(ip_string).ip
+
+        return ip_address(ip_string)
+    except ValueError:
+        return None
+
+
 class PermittedSubnets:
     """
     initializes and verifies if an IP address is part of a permitted subnet
@@ -26,6 +54,9 @@ class PermittedSubnets:
         self.included_subnets = list()
         self.excluded_subnets = list()
 
+        self._excluded_ranges = self._compile_ranges(self.excluded_subnets)
+        self._included_ranges = self._compile_ranges(self.included_subnets)
+
         if config_string is None:
             log.info(f"Config option 'permitted_subnets' is undefined. No IP addresses will be populated to NetBox!")
             return
@@ -54,6 +85,71 @@ class PermittedSubnets:
                 log.error(f"Problem parsing permitted subnet: {e}")
                 self._validation_failed = True
 
+        # compile parsed subnets into integer range lookup tables
+        self._excluded_ranges = self._compile_ranges(self.excluded_subnets)
+        self._included_ranges = self._compile_ranges(self.included_subnets)
+
+    @staticmethod
+    def _compile_ranges(subnets: list) -> dict:
+        """
+        Compile a list of ip_network objects into lookup tables of merged, disjoint
+        (first address, last address) integer ranges per IP version. This way subnet
+        membership can be tested with a single bisect instead of iterating over all
+        subnets for every single IP address.
+
+        Parameters
+        ----------
+        subnets: list
+            list of ip_network objects to compile
+
+        Returns
+        -------
+        dict: of IP version and tuple of two sorted lists (range starts, range ends)
+        """
+
+        compiled_ranges = dict()
+
+        for ip_version in [4, 6]:
+
+            ranges = sorted((int(subnet.network_address), int(subnet.broadcast_address))
+                            for subnet in subnets if subnet.version == ip_version)
+
+            # merge overlapping and adjacent ranges
+            merged_ranges = list()
+            for range_start, range_end in ranges:
+                if len(merged_ranges) > 0 and range_start <= merged_ranges[-1][1] + 1:
+                    merged_ranges[-1][1] = max(merged_ranges[-1][1], range_end)
+                else:
+                    merged_ranges.append([range_start, range_end])
+
+            compiled_ranges[ip_version] = ([x[0] for x in merged_ranges], [x[1] for x in merged_ranges])
+
+        return compiled_ranges
+
+    @staticmethod
+    def _in_ranges(compiled_ranges: dict, ip_a) -> bool:
+        """
+        Test if an IP address is covered by one of the compiled integer ranges.
+
+        Parameters
+        ----------
+        compiled_ranges: dict
+            compiled range lookup tables returned by '_compile_ranges'
+        ip_a: IPv4Address, IPv6Address
+            IP address to look up
+
+        Returns
+        -------
+        bool: if IP address is part of any range
+        """
+
+        range_starts, range_ends = compiled_ranges.get(ip_a.version, (list(), list()))
+
+        ip_int = int(ip_a)
+        index = bisect_right(range_starts, ip_int) - 1
+
+        return index >= 0 and ip_int <= range_ends[index]
+
     @property
     def validation_failed(self) -> bool:
         return self._validation_failed
@@ -88,12 +184,8 @@ class PermittedSubnets:
         if interface_name is not None:
             ip_text = f"{ip_text} for {interface_name}"
 
-        try:
-            if "/" in ip:
-                ip_a = ip_interface(ip).ip
-            else:
-                ip_a = ip_address(ip)
-        except ValueError:
+        ip_a = _parse_ip(ip)
+        if ip_a is None:
             log.error(f"IP address {ip_text} invalid!")
             return False
 
@@ -105,13 +197,11 @@ class PermittedSubnets:
             log.debug(f"IP address {ip_text} is a loopback address. Skipping.")
             return False
 
-        for excluded_subnet in self.excluded_subnets:
-            if ip_a in excluded_subnet:
-                return False
+        if self._in_ranges(self._excluded_ranges, ip_a) is True:
+            return False
 
-        for permitted_subnet in self.included_subnets:
-            if ip_a in permitted_subnet:
-                return True
+        if self._in_ranges(self._included_ranges, ip_a) is True:
+            return True
 
         log.debug(f"IP address {ip_text} not part of any permitted subnet. Skipping.")
         return False
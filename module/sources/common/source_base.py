@@ -13,7 +13,7 @@ from ipaddress import ip_interface, ip_address, IPv6Address, IPv4Address, IPv6Ne
 from packaging import version
 
 from module.netbox import *
-from module.common.logging import get_logger
+from module.common.logging import get_logger, DEBUG2
 from module.common.misc import grab
 
 log = get_logger()
@@ -95,10 +95,12 @@ class SourceBase:
 
         log.debug2("Trying to match current object interfaces in NetBox with discovered interfaces")
 
-        current_object_interfaces = {
+        current_interfaces_by_name = dict()
+        current_interfaces_by_mac = {
             "virtual": dict(),
             "physical": dict()
         }
+        current_interfaces_by_mac_any = dict()
 
         current_object_interface_names = list()
 
@@ -106,22 +108,24 @@ class SourceBase:
 
         # grab current data
         for interface in self.inventory.get_all_interfaces(device_vm_object):
-            int_mac = grab(interface, "data.mac_address")
-            int_name = grab(interface, "data.name")
+            interface_data = getattr(interface, "data", dict())
+            int_mac = interface_data.get("mac_address")
+            int_name = interface_data.get("name")
             int_type = "virtual"
-            if "virtual" not in str(grab(interface, "data.type", fallback="virtual")):
+            if "virtual" not in str(interface_data.get("type") or "virtual"):
                 int_type = "physical"
 
             if int_mac is not None:
-                current_object_interfaces[int_type][int_mac] = interface
-                current_object_interfaces[int_mac] = interface
+                current_interfaces_by_mac[int_type][int_mac] = interface
+                current_interfaces_by_mac_any[int_mac] = interface
 
             if int_name is not None:
-                current_object_interfaces[int_name] = interface
+                current_interfaces_by_name[int_name] = interface
                 current_object_interface_names.append(int_name)
 
-        log.debug2("Found '%d' NICs in NetBox for '%s'" %
-                   (len(current_object_interface_names), device_vm_object.get_display_name()))
+        if log.isEnabledFor(DEBUG2):
+            log.debug2("Found '%d' NICs in NetBox for '%s'",
+                       len(current_object_interface_names), device_vm_object.get_display_name())
 
         unmatched_interface_names = list()
 
@@ -129,34 +133,36 @@ class SourceBase:
 
             return_data[int_name] = None
 
-            int_mac = grab(int_data, "mac_address", fallback="XX:XX:YY:YY:ZZ:ZZ")
+            int_mac = int_data.get("mac_address") or "XX:XX:YY:YY:ZZ:ZZ"
             int_type = "virtual"
-            if "virtual" not in str(grab(int_data, "type", fallback="virtual")):
+            if "virtual" not in str(int_data.get("type") or "virtual"):
                 int_type = "physical"
 
             # match simply by name
             matching_int = None
-            if int_name in current_object_interface_names:
+            if int_name in current_interfaces_by_name:
                 log.debug2(f"Found 1:1 name match for NIC '{int_name}'")
-                matching_int = current_object_interfaces.get(int_name)
+                matching_int = current_interfaces_by_name.get(int_name)
 
             # match mac by interface type
-            elif grab(current_object_interfaces, f"{int_type}.{int_mac}") is not None:
+            elif current_interfaces_by_mac[int_type].get(int_mac) is not None:
                 log.debug2(f"Found 1:1 MAC address match for {int_type} NIC '{int_name}'")
-                matching_int = grab(current_object_interfaces, f"{int_type}.{int_mac}")
+                matching_int = current_interfaces_by_mac[int_type].get(int_mac)
 
             # match mac regardless of interface type
-            elif current_object_interfaces.get(int_mac) is not None and \
-                    current_object_interfaces.get(int_mac) not in return_data.values():
+            elif current_interfaces_by_mac_any.get(int_mac) is not None and \
+                    current_interfaces_by_mac_any.get(int_mac) not in return_data.values():
                 log.debug2(f"Found 1:1 MAC address match for NIC '{int_name}' (ignoring interface type)")
-                matching_int = current_object_interfaces.get(int_mac)
+                matching_int = current_interfaces_by_mac_any.get(int_mac)
 
             if isinstance(matching_int, (NBInterface, NBVMInterface)):
                 return_data[int_name] = matching_int
                 # ToDo:
                 # check why sometimes names are not present anymore and remove fails
-                if grab(matching_int, "data.name") in current_object_interface_names:
-                    current_object_interface_names.remove(grab(matching_int, "data.name"))
+                matching_int_name = matching_int.data.get("name")
+                if matching_int_name in current_interfaces_by_name:
+                    del current_interfaces_by_name[matching_int_name]
+                    current_object_interface_names.remove(matching_int_name)
 
             # no match found, we match the leftovers just by #1 -> #1, #2 -> #2, ...
             else:
@@ -173,8 +179,10 @@ class SourceBase:
             matching_nics = dict(zip(unmatched_interface_names, current_object_interface_names))
 
             for new_int, current_int in matching_nics.items():
-                current_int_object = current_object_interfaces.get(current_int)
-                log.debug2(f"Matching '{new_int}' to NetBox Interface '{current_int_object.get_display_name()}'")
+                current_int_object = current_interfaces_by_name.get(current_int)
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("Matching '%s' to NetBox Interface '%s'",
+                               new_int, current_int_object.get_display_name())
                 return_data[new_int] = current_int_object
 
         return return_data
@@ -231,7 +239,7 @@ class SourceBase:
         return current_longest_matching_prefix
 
     def add_update_interface(self, interface_object, device_object, interface_data, interface_ips=None,
-                             vmware_object=None):
+                             vmware_object=None, guest_tools_status=None):
         """
         Adds/Updates an interface to/of a NBVM or NBDevice including IP addresses.
         Validates/enriches data in following order:
@@ -256,6 +264,9 @@ class SourceBase:
             a list of ip addresses which are assigned to this interface
         vmware_object: vim.HostSystem | vim.VirtualMachine
             object to add to list of objects to reevaluate
+        guest_tools_status: str
+            collected 'guest.toolsRunningStatus' of a VM, avoids querying the
+            status from vCenter for every single interface
 
         Returns
         -------
@@ -362,7 +373,9 @@ class SourceBase:
 
         # skip handling of IPs for VMs with not installed/running guest tools
         skip_ip_handling = False
-        if type(device_object) == NBVM and grab(vmware_object,'guest.toolsRunningStatus') != "guestToolsRunning":
+        if guest_tools_status is None:
+            guest_tools_status = grab(vmware_object, 'guest.toolsRunningStatus')
+        if type(device_object) == NBVM and guest_tools_status != "guestToolsRunning":
             log.debug(f"VM '{device_object.name}' guest tool status is 'NotRunning', skipping IP handling")
             skip_ip_handling = True
 
@@ -524,8 +537,7 @@ class SourceBase:
 
                     if hasattr(self, "objects_to_reevaluate") and vmware_object is not None and \
                             getattr(self, "parsing_objects_to_reevaluate", True) is False:
-                        if vmware_object not in self.objects_to_reevaluate:
-                            self.objects_to_reevaluate.append(vmware_object)
+                        self.objects_to_reevaluate.add(vmware_object)
                         this_log_handler = log.debug
                         log_msg += f" The {device_object.name} will be checked later again to see if " \
                                    f"current interface status or association has changed"
@@ -586,7 +598,9 @@ class SourceBase:
             # update IP address with additional data if not already present
             else:
 
-                log.debug2(f"Found existing NetBox {NBIPAddress.name} object: {this_ip_object.get_display_name()}")
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("Found existing NetBox %s object: %s",
+                               NBIPAddress.name, this_ip_object.get_display_name())
 
                 this_ip_object.update(data=nic_ip_data, source=self)
 
@@ -598,8 +612,9 @@ class SourceBase:
                 continue
 
             if grab(current_ip, "data.role.value") == "anycast":
-                log.debug2(f"{current_ip.name} '{current_ip.get_display_name()}' is an Anycast address and will "
-                          f"NOT be deleted from interface")
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("%s '%s' is an Anycast address and will NOT be deleted from interface",
+                               current_ip.name, current_ip.get_display_name())
                 continue
 
             if current_ip not in ip_address_objects:
@@ -648,8 +663,9 @@ class SourceBase:
                     matching_untagged_vlan = None
 
             elif matching_untagged_vlan is not None:
-                log.debug2(f"Found matching prefix VLAN {matching_untagged_vlan.get_display_name()} for "
-                           f"untagged interface VLAN.")
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("Found matching prefix VLAN %s for untagged interface VLAN.",
+                               matching_untagged_vlan.get_display_name())
 
             if matching_untagged_vlan is not None:
                 vlan_interface_data["untagged_vlan"] = self.add_vlan_group(matching_untagged_vlan, site_name,
@@ -662,8 +678,9 @@ class SourceBase:
 
             matching_tagged_vlan = matching_tagged_vlans.get(grab(tagged_vlan, "vid"))
             if matching_tagged_vlan is not None:
-                log.debug2(f"Found matching prefix VLAN {matching_tagged_vlan.get_display_name()} for "
-                           f"tagged interface VLAN.")
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("Found matching prefix VLAN %s for tagged interface VLAN.",
+                               matching_tagged_vlan.get_display_name())
             else:
                 matching_tagged_vlan = self.get_vlan_object_if_exists(tagged_vlan, device_object_site,
                                                                       device_object_cluster)
@@ -798,7 +815,8 @@ class SourceBase:
                             break
 
         if vlan_group is not None:
-            log.debug2(f"Found matching VLAN group '{vlan_group.get_display_name()}'")
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found matching VLAN group '%s'", vlan_group.get_display_name())
             """
             If a VLAN group has been found we also need to check if the vlan site and the scope of the VLAN group are
             matching. If the VLAN group has a different scope then site, we need to remove the site from the VLAN.
@@ -892,25 +910,31 @@ class SourceBase:
 
         if isinstance(vlan_object_by_site, NetBoxObject):
             return_data = vlan_object_by_site
-            log.debug2(f"Found a {return_data.name} object which matches the site '{vlan_site.get_display_name()}': %s"
-                       % vlan_object_by_site.get_display_name(including_second_key=True))
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found a %s object which matches the site '%s': %s",
+                           return_data.name, vlan_site.get_display_name(),
+                           vlan_object_by_site.get_display_name(including_second_key=True))
 
         elif isinstance(vlan_object_by_group, NetBoxObject):
             return_data = vlan_object_by_group
-            vlan_group_object = grab(vlan_object_by_group, "data.group")
-            vlan_group_object_scope_object = grab(vlan_object_by_group, "data.scope_id")
-            scope_details = ""
-            if vlan_group_object_scope_object is not None:
-                scope_details = (f" ({vlan_group_object_scope_object.name} "
-                                 f"{vlan_group_object_scope_object.get_display_name()})")
-            log.debug2(f"Found a {return_data.name} object which matches the {vlan_group_object.name} "
-                       f"'{vlan_group_object.get_display_name()}'{scope_details}: %s" %
-                       vlan_object_by_group.get_display_name(including_second_key=True))
+            if log.isEnabledFor(DEBUG2):
+                vlan_group_object = grab(vlan_object_by_group, "data.group")
+                vlan_group_object_scope_object = grab(vlan_object_by_group, "data.scope_id")
+                scope_details = ""
+                if vlan_group_object_scope_object is not None:
+                    scope_details = (f" ({vlan_group_object_scope_object.name} "
+                                     f"{vlan_group_object_scope_object.get_display_name()})")
+                log.debug2("Found a %s object which matches the %s '%s'%s: %s",
+                           return_data.name, vlan_group_object.name,
+                           vlan_group_object.get_display_name(), scope_details,
+                           vlan_object_by_group.get_display_name(including_second_key=True))
 
         elif isinstance(vlan_object_global, NetBoxObject):
             return_data = vlan_object_global
-            log.debug2(f"Found a global matching {return_data.name} object: %s" %
-                       vlan_object_global.get_display_name(including_second_key=True))
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found a global matching %s object: %s",
+                           return_data.name,
+                           vlan_object_global.get_display_name(including_second_key=True))
 
         else:
             log.debug2("No matching existing VLAN found for this VLAN ID.")
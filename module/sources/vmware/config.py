@@ -8,6 +8,7 @@
 #  repository or visit: <https://opensource.org/licenses/MIT>.
 
 import re
+from functools import lru_cache
 from ipaddress import ip_address
 
 from module.common.misc import quoted_split
@@ -23,6 +24,10 @@ from module.common.support import normalize_mac_address
 
 log = get_logger()
 
+# cache compiled filter/relation regexes, the same pattern strings are
+# compiled again on every validation run in long-running processes
+_cached_re_compile = lru_cache(maxsize=128)(re.compile)
+
 
 class VMWareConfig(ConfigBase):
 
@@ -460,7 +465,7 @@ class VMWareConfig(ConfigBase):
 
                 re_compiled = None
                 try:
-                    re_compiled = re.compile(option.value)
+                    re_compiled = _cached_re_compile(option.value)
                 except Exception as e:
                     log.error(f"Problem parsing regular expression for '{self.source_name}.{option.key}': {e}")
                     self.set_validation_failed()
@@ -493,7 +498,7 @@ class VMWareConfig(ConfigBase):
                         continue
 
                     try:
-                        re_compiled = re.compile(object_name)
+                        re_compiled = _cached_re_compile(object_name)
                     except Exception as e:
                         log.error(f"Problem parsing regular expression '{object_name}' for '{relation}': {e}")
                         self.set_validation_failed()
@@ -10,6 +10,8 @@
 import datetime
 import pprint
 import ssl
+from collections import Counter, defaultdict
+from functools import lru_cache
 from ipaddress import ip_address, ip_interface
 from urllib.parse import unquote
 from itertools import zip_longest
@@ -22,14 +24,14 @@ from packaging import version
 # noinspection PyUnresolvedReferences
 from pyVim import connect
 # noinspection PyUnresolvedReferences
-from pyVmomi import vim
+from pyVmomi import vim, vmodl
 # noinspection PyUnresolvedReferences
 from pyVmomi.VmomiSupport import VmomiJSONEncoder
 
 from module.sources.common.source_base import SourceBase
 from module.sources.vmware.config import VMWareConfig
-from module.common.logging import get_logger, DEBUG3
-from module.common.misc import grab, dump, get_string_or_none, plural, quoted_split
+from module.common.logging import get_logger, DEBUG2, DEBUG3
+from module.common.misc import grab, direct_grab, dump, get_string_or_none, plural, quoted_split
 from module.common.support import normalize_mac_address
 from module.netbox.inventory import NetBoxInventory
 from module.netbox import *
@@ -45,6 +47,121 @@ except ImportError:
 
 log = get_logger()
 
+@lru_cache(maxsize=4096)
+def _cached_ip_interface(ip_interface_string):
+    """
+    memoized ip_interface construction, returns None instead of raising
+    on unparsable input. IP addresses repeat across NICs and sync runs,
+    this avoids re-parsing the same strings over and over.
+
+    Parameters
+    ----------
+    ip_interface_string: str
+        IP address in interface notation (i.e. 10.0.0.1/24)
+
+    Returns
+    -------
+    (IPv4Interface, IPv6Interface, None): parsed interface object or None
+    """
+
+    try:
+        return ip_interface(ip_interface_string)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _cached_ip_address(ip_address_string):
+    """
+    memoized ip_address construction, returns None instead of raising
+    on unparsable input. Route networks and gateways repeat across many
+    VMs, this avoids re-parsing the same strings over and over.
+
+    Parameters
+    ----------
+    ip_address_string: str
+        IP address in plain notation (i.e. 10.0.0.1)
+
+    Returns
+    -------
+    (IPv4Address, IPv6Address, None): parsed address object or None
+    """
+
+    try:
+        return ip_address(ip_address_string)
+    except ValueError:
+        return None
+
+# hardware identifier keys which may contain the host serial number, in order of preference
+host_serial_identifier_keys = ("SerialNumberTag", "ServiceTag", "EnclosureSerialNumberTag")
+
+# asset tag values (lower case) which indicate that no real asset tag is set
+banned_asset_tags = frozenset({
+    "default string", "na", "n/a", "none", "null", "oem", "o.e.m",
+    "to be filled by o.e.m.", "unknown"
+})
+
+# property paths which get requested in one PropertyCollector call per container view.
+# Each handler receives the result as a flat {path: value} dict and only needs to fall
+# back to attribute traversal (one SOAP round trip per attribute) for uncollected paths.
+datacenter_property_paths = [
+    "name",
+    "parent"
+]
+
+cluster_property_paths = [
+    "name",
+    "parent"
+]
+
+port_group_property_paths = [
+    "key",
+    "name",
+    "config.defaultPortConfig.vlan"
+]
+
+host_property_paths = [
+    "name",
+    "parent",
+    "summary.hardware.vendor",
+    "summary.hardware.model",
+    "summary.hardware.otherIdentifyingInfo",
+    "summary.hardware.numCpuCores",
+    "summary.hardware.cpuModel",
+    "summary.hardware.memorySize",
+    "summary.config.product.name",
+    "summary.config.product.version",
+    "summary.runtime.connectionState",
+    "config.network.vswitch",
+    "config.network.proxySwitch",
+    "config.network.portgroup",
+    "config.network.pnic",
+    "config.network.vnic",
+    "customValue",
+    "availableField"
+]
+
+vm_property_paths = [
+    "name",
+    "config.instanceUuid",
+    "config.template",
+    "config.managedBy.extensionKey",
+    "config.guestFullName",
+    "config.extraConfig",
+    "config.annotation",
+    "config.hardware.device",
+    "config.hardware.memoryMB",
+    "config.hardware.numCPU",
+    "runtime.powerState",
+    "runtime.host",
+    "guest.guestFullName",
+    "guest.ipStack",
+    "guest.net",
+    "guest.toolsRunningStatus",
+    "customValue",
+    "availableField"
+]
+
 
 # noinspection PyTypeChecker
 class VMWareHandler(SourceBase):
@@ -80,8 +197,6 @@ class VMWareHandler(SourceBase):
 
     source_type = "vmware"
 
-    recursion_level = 0
-
     # internal vars
     session = None
     tag_session = None
@@ -129,10 +244,12 @@ class VMWareHandler(SourceBase):
         }
         self.processed_host_names = dict()
         self.processed_vm_names = dict()
-        self.processed_vm_uuid = list()
+        self.processed_vm_uuid = set()
         self.object_cache = dict()
+        self._primary_ip_index = dict()
+        self._vmware_parent_map = dict()
         self.parsing_vms_the_first_time = True
-        self.objects_to_reevaluate = list()
+        self.objects_to_reevaluate = set()
         self.parsing_objects_to_reevaluate = False
 
     def create_sdk_session(self):
@@ -147,6 +264,16 @@ class VMWareHandler(SourceBase):
         if self.session is not None:
             return True
 
+        # disconnect a stale SDK instance from a previous connection attempt,
+        # otherwise its server-side session lingers until the process exits
+        if self._sdk_instance is not None:
+            # noinspection PyBroadException
+            try:
+                connect.Disconnect(self._sdk_instance)
+            except Exception:
+                pass
+            self._sdk_instance = None
+
         log.debug(f"Starting vCenter SDK connection to '{self.settings.host_fqdn}'")
 
         ssl_context = ssl.create_default_context()
@@ -263,6 +390,108 @@ class VMWareHandler(SourceBase):
 
         return True
 
+    def _collect_properties(self, container_view, view_type, path_set):
+        """
+        Retrieve all properties defined in 'path_set' for every object of a container view
+        with a single PropertyCollector call instead of one SOAP round trip per attribute.
+
+        Parameters
+        ----------
+        container_view: vim.view.ContainerView
+            container view to traverse
+        view_type: vim managed object type
+            type of objects contained in this view
+        path_set: list
+            list of property paths to retrieve for each object
+
+        Returns
+        -------
+        dict: of {managed_object: {property_path: value}} or None if collection failed
+        """
+
+        traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+            name="traverseEntities",
+            path="view",
+            skip=False,
+            type=type(container_view)
+        )
+
+        object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+            obj=container_view,
+            skip=True,
+            selectSet=[traversal_spec]
+        )
+
+        property_spec = vmodl.query.PropertyCollector.PropertySpec(
+            type=view_type,
+            pathSet=path_set
+        )
+
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[object_spec],
+            propSet=[property_spec]
+        )
+
+        retrieve_options = vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=500)
+
+        property_collector = self.session.propertyCollector
+
+        collected_properties = dict()
+
+        try:
+            result = property_collector.RetrievePropertiesEx([filter_spec], retrieve_options)
+
+            while result is not None:
+
+                for object_result in result.objects:
+                    # pre-fill all requested paths so unset properties resolve to 'None'
+                    # without triggering a fallback SOAP request
+                    object_properties = dict.fromkeys(path_set)
+                    for object_property in object_result.propSet:
+                        object_properties[object_property.name] = object_property.val
+
+                    collected_properties[object_result.obj] = object_properties
+
+                if result.token is None:
+                    break
+
+                result = property_collector.ContinueRetrievePropertiesEx(result.token)
+
+        except Exception as e:
+            log.error(f"Problem retrieving properties via PropertyCollector: {e}")
+            return None
+
+        return collected_properties
+
+    @staticmethod
+    def get_prop(obj, props, path, fallback=None):
+        """
+        Return an object property which was already retrieved via the PropertyCollector.
+        Falls back to 'grab()' on the live managed object (one SOAP round trip per
+        attribute) if the property path is not part of the collected set.
+
+        Parameters
+        ----------
+        obj
+            pyvmomi managed object the properties belong to
+        props: dict, None
+            dict of collected properties for this object
+        path: str
+            property path to return
+        fallback
+            value to return if property is unset
+
+        Returns
+        -------
+        the requested property value, otherwise fallback
+        """
+
+        if props is not None and path in props:
+            value = props.get(path)
+            return value if value is not None else fallback
+
+        return grab(obj, path, fallback=fallback)
+
     def finish(self):
 
         # closing tag session
@@ -314,31 +543,38 @@ class VMWareHandler(SourceBase):
         object_mapping = {
             "datacenter": {
                 "view_type": vim.Datacenter,
-                "view_handler": self.add_datacenter
+                "view_handler": self.add_datacenter,
+                "property_paths": datacenter_property_paths
             },
             "cluster": {
                 "view_type": vim.ClusterComputeResource,
-                "view_handler": self.add_cluster
+                "view_handler": self.add_cluster,
+                "property_paths": cluster_property_paths
             },
             "single host cluster": {
                 "view_type": vim.ComputeResource,
-                "view_handler": self.add_cluster
+                "view_handler": self.add_cluster,
+                "property_paths": cluster_property_paths
             },
             "network": {
                 "view_type": vim.dvs.DistributedVirtualPortgroup,
-                "view_handler": self.add_port_group
+                "view_handler": self.add_port_group,
+                "property_paths": port_group_property_paths
             },
             "host": {
                 "view_type": vim.HostSystem,
-                "view_handler": self.add_host
+                "view_handler": self.add_host,
+                "property_paths": host_property_paths
             },
             "virtual machine": {
                 "view_type": vim.VirtualMachine,
-                "view_handler": self.add_virtual_machine
+                "view_handler": self.add_virtual_machine,
+                "property_paths": vm_property_paths
             },
             "offline virtual machine": {
                 "view_type": vim.VirtualMachine,
-                "view_handler": self.add_virtual_machine
+                "view_handler": self.add_virtual_machine,
+                "property_paths": vm_property_paths
             }
         }
 
@@ -347,6 +583,10 @@ class VMWareHandler(SourceBase):
             log.info("Skipping offline VMs")
             del object_mapping["offline virtual machine"]
 
+        # cache of VM view objects and properties from the first VM pass,
+        # reused for the second pass over offline VMs
+        vm_view_cache = None
+
         for view_name, view_details in object_mapping.items():
 
             # test if session is still alive
@@ -363,23 +603,43 @@ class VMWareHandler(SourceBase):
                 log.error("Recreating session failed")
                 break
 
-            view_data = {
-                "container": self.session.rootFolder,
-                "type": [view_details.get("view_type")],
-                "recursive": True
-            }
+            container_view = None
 
-            try:
-                container_view = self.session.viewManager.CreateContainerView(**view_data)
-            except Exception as e:
-                log.error(f"Problem creating vCenter view for '{view_name}s': {e}")
-                continue
+            # both VM passes iterate the exact same objects, only the handler
+            # behaves differently. Reuse objects and properties collected in
+            # the first pass instead of querying the same data again.
+            if view_name == "offline virtual machine" and vm_view_cache is not None:
+                collected_properties, view_objects = vm_view_cache
 
-            view_objects = grab(container_view, "view")
+            else:
+                view_data = {
+                    "container": self.session.rootFolder,
+                    "type": [view_details.get("view_type")],
+                    "recursive": True
+                }
 
-            if view_objects is None:
-                log.error(f"Creating vCenter view for '{view_name}s' failed!")
-                continue
+                try:
+                    container_view = self.session.viewManager.CreateContainerView(**view_data)
+                except Exception as e:
+                    log.error(f"Problem creating vCenter view for '{view_name}s': {e}")
+                    continue
+
+                # fetch all needed properties for all objects of this view in one batched call
+                collected_properties = self._collect_properties(container_view,
+                                                                view_details.get("view_type"),
+                                                                view_details.get("property_paths"))
+
+                if collected_properties is not None:
+                    view_objects = list(collected_properties.keys())
+                else:
+                    view_objects = grab(container_view, "view")
+
+                if view_objects is None:
+                    log.error(f"Creating vCenter view for '{view_name}s' failed!")
+                    continue
+
+                if view_name == "virtual machine":
+                    vm_view_cache = (collected_properties, view_objects)
 
             if view_name != "offline virtual machine":
                 log.debug("vCenter returned '%d' %s%s" % (len(view_objects), view_name, plural(len(view_objects))))
@@ -387,18 +647,37 @@ class VMWareHandler(SourceBase):
                 self.parsing_vms_the_first_time = False
                 log.debug("Iterating over all virtual machines a second time ")
 
+            # remember parent relations from collected properties, this way
+            # get_parent_object_by_class can walk the hierarchy without
+            # issuing a SOAP request per 'parent' attribute access
+            if collected_properties is not None:
+                for obj, obj_props in collected_properties.items():
+                    obj_parent = obj_props.get("parent")
+                    if obj_parent is not None:
+                        self._vmware_parent_map[obj] = obj_parent
+
             for obj in view_objects:
 
+                props = None
+                if collected_properties is not None:
+                    props = collected_properties.get(obj)
+
                 if log.level == DEBUG3:
+                    # print the already collected properties if available, dumping
+                    # the live managed object would issue one SOAP request per attribute
                     try:
-                        dump(obj)
+                        if props is not None:
+                            pprint.pprint(props)
+                        else:
+                            dump(obj)
                     except Exception as e:
                         log.error(e)
 
                 # noinspection PyArgumentList
-                view_details.get("view_handler")(obj)
+                view_details.get("view_handler")(obj, props)
 
-            container_view.Destroy()
+            if container_view is not None:
+                container_view.Destroy()
 
         self.parsing_objects_to_reevaluate = True
         log.info("Parsing objects which were marked to be reevaluated")
@@ -513,8 +792,8 @@ class VMWareHandler(SourceBase):
         ----------
         object_type: (NBDevice, NBVM)
             type of NetBox device to find in inventory
-        mac_list: list
-            a list of MAC addresses to compare against NetBox interface objects
+        mac_list: list, set
+            a list/set of MAC addresses to compare against NetBox interface objects
 
         Returns
         -------
@@ -526,38 +805,37 @@ class VMWareHandler(SourceBase):
         if object_type not in [NBDevice, NBVM]:
             raise ValueError(f"Object must be a '{NBVM.name}' or '{NBDevice.name}'.")
 
-        if mac_list is None or not isinstance(mac_list, list) or len(mac_list) == 0:
+        if mac_list is None or not isinstance(mac_list, (list, set)) or len(mac_list) == 0:
             return
 
         interface_typ = NBInterface if object_type == NBDevice else NBVMInterface
 
-        objects_with_matching_macs = dict()
+        objects_with_matching_macs = Counter()
         matching_object = None
 
-        for interface in self.inventory.get_all_items(interface_typ):
+        for mac_address in mac_list:
 
-            if grab(interface, "data.mac_address") in mac_list:
+            for interface in self.inventory.get_interfaces_by_mac(interface_typ, mac_address):
 
                 matching_object = grab(interface, f"data.{interface.secondary_key}")
                 if not isinstance(matching_object, (NBDevice, NBVM)):
                     continue
 
-                log.debug2("Found matching MAC '%s' on %s '%s'" %
-                           (grab(interface, "data.mac_address"), object_type.name,
-                            matching_object.get_display_name(including_second_key=True)))
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("Found matching MAC '%s' on %s '%s'",
+                               mac_address, object_type.name,
+                               matching_object.get_display_name(including_second_key=True))
 
-                if objects_with_matching_macs.get(matching_object) is None:
-                    objects_with_matching_macs[matching_object] = 1
-                else:
-                    objects_with_matching_macs[matching_object] += 1
+                objects_with_matching_macs[matching_object] += 1
 
         # try to find object based on amount of matching MAC addresses
         num_devices_witch_matching_macs = len(objects_with_matching_macs.keys())
 
         if num_devices_witch_matching_macs == 1 and isinstance(matching_object, (NBDevice, NBVM)):
 
-            log.debug2("Found one %s '%s' based on MAC addresses and using it" %
-                       (object_type.name, matching_object.get_display_name(including_second_key=True)))
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found one %s '%s' based on MAC addresses and using it",
+                           object_type.name, matching_object.get_display_name(including_second_key=True))
 
             object_to_return = list(objects_with_matching_macs.keys())[0]
 
@@ -566,22 +844,21 @@ class VMWareHandler(SourceBase):
             log.debug2(f"Found {num_devices_witch_matching_macs} {object_type.name}s with matching MAC addresses")
 
             # now select the two top matches
-            first_choice, second_choice = \
-                sorted(objects_with_matching_macs, key=objects_with_matching_macs.get, reverse=True)[0:2]
-
-            first_choice_matches = objects_with_matching_macs.get(first_choice)
-            second_choice_matches = objects_with_matching_macs.get(second_choice)
-
-            log.debug2(f"The top candidate {first_choice.get_display_name()} with {first_choice_matches} matches")
-            log.debug2(f"The second candidate {second_choice.get_display_name()} with {second_choice_matches} matches")
-
-            # get ratio between
-            matching_ration = first_choice_matches / second_choice_matches
-
-            # only pick the first one if the ration exceeds 2
-            if matching_ration >= 2.0:
-                log.debug2(f"The matching ratio of {matching_ration} is high enough "
-                           f"to select {first_choice.get_display_name()} as desired {object_type.name}")
+            (first_choice, first_choice_matches), (second_choice, second_choice_matches) = \
+                objects_with_matching_macs.most_common(2)
+
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("The top candidate %s with %d matches",
+                           first_choice.get_display_name(), first_choice_matches)
+                log.debug2("The second candidate %s with %d matches",
+                           second_choice.get_display_name(), second_choice_matches)
+
+            # only pick the first one if it has at least twice as many matches
+            if first_choice_matches >= 2 * second_choice_matches:
+                if log.isEnabledFor(DEBUG2):
+                    log.debug2("The top candidate has at least twice as many matching MAC addresses, "
+                               "selecting %s as desired %s",
+                               first_choice.get_display_name(), object_type.name)
                 object_to_return = first_choice
             else:
                 log.debug2("Both candidates have a similar amount of "
@@ -609,21 +886,20 @@ class VMWareHandler(SourceBase):
 
         """
 
-        def _matches_device_primary_ip(device_primary_ip, ip_needle):
+        def _device_primary_ip_address(device_primary_ip):
 
             ip = None
-            if device_primary_ip is not None and ip_needle is not None:
-                if isinstance(device_primary_ip, dict):
-                    ip = grab(device_primary_ip, "address")
+            if isinstance(device_primary_ip, dict):
+                ip = grab(device_primary_ip, "address")
 
-                elif isinstance(device_primary_ip, int):
-                    ip = self.inventory.get_by_id(NBIPAddress, nb_id=device_primary_ip)
-                    ip = grab(ip, "data.address")
+            elif isinstance(device_primary_ip, int):
+                ip = self.inventory.get_by_id(NBIPAddress, nb_id=device_primary_ip)
+                ip = grab(ip, "data.address")
 
-                if ip is not None and ip.split("/")[0] == ip_needle:
-                    return True
+            if ip is not None:
+                return ip.split("/")[0]
 
-            return False
+            return None
 
         if object_type not in [NBDevice, NBVM]:
             raise ValueError(f"Object must be a '{NBVM.name}' or '{NBDevice.name}'.")
@@ -637,17 +913,40 @@ class VMWareHandler(SourceBase):
         if primary_ip6 is not None:
             primary_ip6 = str(primary_ip6).split("/")[0]
 
-        for device in self.inventory.get_all_items(object_type):
-
-            if _matches_device_primary_ip(grab(device, "data.primary_ip4"), primary_ip4) is True:
-                log.debug2(f"Found existing host '{device.get_display_name()}' "
-                           f"based on the primary IPv4 '{primary_ip4}'")
-                return device
-
-            if _matches_device_primary_ip(grab(device, "data.primary_ip6"), primary_ip6) is True:
-                log.debug2(f"Found existing host '{device.get_display_name()}' "
-                           f"based on the primary IPv6 '{primary_ip6}'")
-                return device
+        # build a primary IP lookup table on first use instead of extracting
+        # both primary IPs of every device again on each call. Only primary IPs
+        # read from NetBox appear as dict/int values, primary IPs assigned
+        # during this run are NBIPAddress objects which never matched here
+        # anyway, so this index does not need invalidation.
+        primary_ip_index = self._primary_ip_index.get(object_type)
+        if primary_ip_index is None:
+            primary_ip_index = dict()
+            for order, device in enumerate(self.inventory.get_all_items(object_type)):
+                for ip_key in ["primary_ip4", "primary_ip6"]:
+                    device_ip = _device_primary_ip_address(device.data.get(ip_key))
+                    if device_ip is not None:
+                        primary_ip_index.setdefault(device_ip, (order, device))
+
+            self._primary_ip_index[object_type] = primary_ip_index
+
+        ipv4_match = primary_ip_index.get(primary_ip4)
+        ipv6_match = primary_ip_index.get(primary_ip6)
+
+        # prefer the device which would have been found first when iterating
+        # over the inventory, checking IPv4 before IPv6 per device
+        if ipv4_match is not None and (ipv6_match is None or ipv4_match[0] <= ipv6_match[0]):
+            device = ipv4_match[1]
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found existing host '%s' based on the primary IPv4 '%s'",
+                           device.get_display_name(), primary_ip4)
+            return device
+
+        if ipv6_match is not None:
+            device = ipv6_match[1]
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found existing host '%s' based on the primary IPv6 '%s'",
+                           device.get_display_name(), primary_ip6)
+            return device
 
     def get_vmware_object_tags(self, obj):
         """
@@ -760,7 +1059,7 @@ class VMWareHandler(SourceBase):
 
         return tag_list
 
-    def get_object_custom_fields(self, obj):
+    def get_object_custom_fields(self, obj, props=None):
         """
         Get custom attributes from vCenter for submitted object and as NetBox custom fields
 
@@ -768,6 +1067,8 @@ class VMWareHandler(SourceBase):
         ----------
         obj
             pyvmomi object to retrieve custom attributes from
+        props: dict
+            dict of properties collected for this object
 
         Returns
         -------
@@ -779,7 +1080,7 @@ class VMWareHandler(SourceBase):
 
         custom_value = list()
         if self.settings.sync_custom_attributes is True:
-            custom_value = grab(obj, "customValue", fallback=list())
+            custom_value = self.get_prop(obj, props, "customValue", fallback=list())
 
         if grab(obj, "_wsdlName") == "VirtualMachine":
             object_type = "virtualization.virtualmachine"
@@ -792,9 +1093,9 @@ class VMWareHandler(SourceBase):
 
         # add basic host data to device
         if object_type == "dcim.device":
-            num_cpu_cores = grab(obj, "summary.hardware.numCpuCores")
-            cpu_model = grab(obj, "summary.hardware.cpuModel")
-            memory_size = grab(obj, "summary.hardware.memorySize")
+            num_cpu_cores = self.get_prop(obj, props, "summary.hardware.numCpuCores")
+            cpu_model = self.get_prop(obj, props, "summary.hardware.cpuModel")
+            memory_size = self.get_prop(obj, props, "summary.hardware.memorySize")
 
             if num_cpu_cores is not None:
                 custom_field = self.add_update_custom_field({
@@ -825,7 +1126,7 @@ class VMWareHandler(SourceBase):
 
                 return_custom_fields[grab(custom_field, "data.name")] = f"{memory_size} {memory_unit}"
 
-        field_definition = {grab(k, "key"): grab(k, "name") for k in grab(obj, "availableField", fallback=list())}
+        field_definition = {grab(k, "key"): grab(k, "name") for k in self.get_prop(obj, props, "availableField", fallback=list())}
 
         for obj_custom_field in custom_value:
             key = grab(obj_custom_field, "key")
@@ -948,7 +1249,8 @@ class VMWareHandler(SourceBase):
             return resolved_name
 
     def add_device_vm_to_inventory(self, object_type, object_data, pnic_data=None, vnic_data=None,
-                                   nic_ips=None, p_ipv4=None, p_ipv6=None, vmware_object=None, disk_data=None):
+                                   nic_ips=None, p_ipv4=None, p_ipv6=None, vmware_object=None, disk_data=None,
+                                   guest_tools_status=None):
         """
         Add/update device/VM object in inventory based on gathered data.
 
@@ -1011,6 +1313,9 @@ class VMWareHandler(SourceBase):
             vmware object to pass on to 'add_update_interface' method to set up reevaluation
         disk_data: list
             data of discs which belong to a VM
+        guest_tools_status: str
+            collected 'guest.toolsRunningStatus' of a VM, passed on to 'add_update_interface'
+            to avoid querying it per interface
 
         """
 
@@ -1035,8 +1340,9 @@ class VMWareHandler(SourceBase):
         device_vm_object = self.inventory.get_by_data(object_type, data=object_data)
 
         if device_vm_object is not None:
-            log.debug2("Found a exact matching %s object: %s" %
-                       (object_type.name, device_vm_object.get_display_name(including_second_key=True)))
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found a exact matching %s object: %s",
+                           object_type.name, device_vm_object.get_display_name(including_second_key=True))
 
         # keep searching if no exact match was found
         else:
@@ -1046,7 +1352,8 @@ class VMWareHandler(SourceBase):
             # on VMs vnic data is used, on physical devices pnic data is used
             mac_source_data = vnic_data if object_type == NBVM else pnic_data
 
-            nic_macs = [x.get("mac_address") for x in mac_source_data.values()]
+            # dedup MAC addresses and drop interfaces without one
+            nic_macs = {x.get("mac_address") for x in mac_source_data.values() if x.get("mac_address") is not None}
 
             device_vm_object = self.get_object_based_on_macs(object_type, nic_macs)
 
@@ -1071,8 +1378,9 @@ class VMWareHandler(SourceBase):
             device_vm_object = self.inventory.get_by_data(object_type, data={"serial": object_data.get("serial")})
 
         if device_vm_object is not None:
-            log.debug2("Found a matching %s object: %s" %
-                       (object_type.name, device_vm_object.get_display_name(including_second_key=True)))
+            if log.isEnabledFor(DEBUG2):
+                log.debug2("Found a matching %s object: %s",
+                           object_type.name, device_vm_object.get_display_name(including_second_key=True))
 
         # keep looking for devices with the same primary IP
         else:
@@ -1185,7 +1493,8 @@ class VMWareHandler(SourceBase):
             # add/update interface with retrieved data
             nic_object, ip_address_objects = self.add_update_interface(nic_object_dict.get(int_name), device_vm_object,
                                                                        int_data, nic_ips.get(int_name, list()),
-                                                                       vmware_object=vmware_object)
+                                                                       vmware_object=vmware_object,
+                                                                       guest_tools_status=guest_tools_status)
 
             # add all interface IPs
             for ip_object in ip_address_objects:
@@ -1243,28 +1552,34 @@ class VMWareHandler(SourceBase):
             return
 
         if isinstance(obj, object_class_to_find):
-            self.recursion_level = 0
             return obj
 
         max_recursion = 20
-        while True:
-            if self.recursion_level >= max_recursion:
-                self.recursion_level = 0
-                return None
+        current_object = obj
+        for _ in range(max_recursion):
 
-            # noinspection PyBroadException
-            try:
-                parent = obj.parent
-            except Exception:
-                self.recursion_level = 0
-                return None
+            parent = self._vmware_parent_map.get(current_object)
+
+            if parent is None:
+                # noinspection PyBroadException
+                try:
+                    parent = current_object.parent
+                except Exception:
+                    return None
+
+                if parent is None:
+                    return None
+
+                # remember resolved parent, walking the same hierarchy
+                # again resolves from cache without a SOAP request
+                self._vmware_parent_map[current_object] = parent
 
             if isinstance(parent, object_class_to_find):
-                self.recursion_level = 0
                 return parent
 
-            self.recursion_level += 1
-            return self.get_parent_object_by_class(parent, object_class_to_find)
+            current_object = parent
+
+        return None
 
     def add_object_to_cache(self, vm_object, netbox_object):
 
@@ -1302,7 +1617,7 @@ class VMWareHandler(SourceBase):
 
         return self.object_cache[vm_class_name].get(vm_object_id)
 
-    def add_datacenter(self, obj):
+    def add_datacenter(self, obj, props=None):
         """
         Add a vCenter datacenter as a NBClusterGroup to NetBox
 
@@ -1310,12 +1625,14 @@ class VMWareHandler(SourceBase):
         ----------
         obj: vim.Datacenter
             a datacenter object
+        props: dict
+            dict of properties collected for this object
 
         """
         if self.settings.set_source_name_as_cluster_group is True:
             name = self.name
         else:
-            name = get_string_or_none(grab(obj, "name"))
+            name = get_string_or_none(self.get_prop(obj, props, "name"))
 
         if name is None:
             return
@@ -1335,12 +1652,12 @@ class VMWareHandler(SourceBase):
             })
 
             object_data["custom_fields"] = {
-                grab(custom_field, "data.name"): get_string_or_none(grab(obj, "name"))
+                grab(custom_field, "data.name"): get_string_or_none(self.get_prop(obj, props, "name"))
             }
 
         self.add_object_to_cache(obj, self.inventory.add_update_object(NBClusterGroup, data=object_data, source=self))
 
-    def add_cluster(self, obj):
+    def add_cluster(self, obj, props=None):
         """
         Add a vCenter cluster as a NBCluster to NetBox. Cluster name is checked against
         cluster_include_filter and cluster_exclude_filter config setting.
@@ -1349,9 +1666,11 @@ class VMWareHandler(SourceBase):
         ----------
         obj: vim.ClusterComputeResource
             cluster to add
+        props: dict
+            dict of properties collected for this object
         """
 
-        name = get_string_or_none(grab(obj, "name"))
+        name = get_string_or_none(self.get_prop(obj, props, "name"))
         if self.settings.set_source_name_as_cluster_group is True:
             group = self.inventory.get_by_data(NBClusterGroup, data={"name": self.name})
         else:
@@ -1478,7 +1797,7 @@ class VMWareHandler(SourceBase):
         for port in ports:
             self.network_data["dpgroup_ports"][uuid][port.key] = port
 
-    def add_port_group(self, obj):
+    def add_port_group(self, obj, props=None):
         """
         Parse distributed virtual port group to extract VLAN IDs from each port group
 
@@ -1486,10 +1805,12 @@ class VMWareHandler(SourceBase):
         ----------
         obj: vim.dvs.DistributedVirtualPortgroup
             portgroup to parse
+        props: dict
+            dict of properties collected for this object
         """
 
-        key = get_string_or_none(grab(obj, "key"))
-        name = get_string_or_none(grab(obj, "name"))
+        key = get_string_or_none(self.get_prop(obj, props, "key"))
+        name = get_string_or_none(self.get_prop(obj, props, "name"))
         private = False
         vlan_ids = list()
         vlan_id_ranges = list()
@@ -1499,7 +1820,7 @@ class VMWareHandler(SourceBase):
 
         log.debug(f"Parsing vCenter port group: {name}")
 
-        vlan_info = grab(obj, "config.defaultPortConfig.vlan")
+        vlan_info = self.get_prop(obj, props, "config.defaultPortConfig.vlan")
 
         if isinstance(vlan_info, vim.dvs.VmwareDistributedVirtualSwitch.TrunkVlanSpec):
             for item in grab(vlan_info, "vlanId", fallback=list()):
@@ -1526,7 +1847,7 @@ class VMWareHandler(SourceBase):
             "private": private
         }
 
-    def add_host(self, obj):
+    def add_host(self, obj, props=None):
         """
         Parse a vCenter host (ESXi) add to NetBox once all data is gathered.
 
@@ -1548,9 +1869,11 @@ class VMWareHandler(SourceBase):
         ----------
         obj: vim.HostSystem
             host object to parse
+        props: dict
+            dict of properties collected for this object
         """
 
-        name = get_string_or_none(grab(obj, "name"))
+        name = get_string_or_none(self.get_prop(obj, props, "name"))
 
         if name is not None and self.settings.strip_host_domain_name is True:
             name = name.split(".")[0]
@@ -1596,16 +1919,13 @@ class VMWareHandler(SourceBase):
         group_name = grab(group, "data.name")
         site_name = self.get_site_name(NBDevice, name, f"{group_name}/{cluster_name}")
 
-        if name in self.processed_host_names.get(site_name, list()) and obj not in self.objects_to_reevaluate:
+        if name in self.processed_host_names.get(site_name, set()) and obj not in self.objects_to_reevaluate:
             log.warning(f"Host '{name}' for site '{site_name}' already parsed. "
                         "Make sure to use unique host names. Skipping")
             return
 
         # add host to processed list
-        if self.processed_host_names.get(site_name) is None:
-            self.processed_host_names[site_name] = list()
-
-        self.processed_host_names[site_name].append(name)
+        self.processed_host_names.setdefault(site_name, set()).add(name)
 
         # filter hosts by name
         if self.passes_filter(name, self.settings.host_include_filter, self.settings.host_exclude_filter) is False:
@@ -1616,10 +1936,10 @@ class VMWareHandler(SourceBase):
         #
 
         # collect all necessary data
-        manufacturer = get_string_or_none(grab(obj, "summary.hardware.vendor"))
-        model = get_string_or_none(grab(obj, "summary.hardware.model"))
-        product_name = get_string_or_none(grab(obj, "summary.config.product.name"))
-        product_version = get_string_or_none(grab(obj, "summary.config.product.version"))
+        manufacturer = get_string_or_none(self.get_prop(obj, props, "summary.hardware.vendor"))
+        model = get_string_or_none(self.get_prop(obj, props, "summary.hardware.model"))
+        product_name = get_string_or_none(self.get_prop(obj, props, "summary.config.product.name"))
+        product_version = get_string_or_none(self.get_prop(obj, props, "summary.config.product.version"))
 
         # collect platform
         platform = f"{product_name} {product_version}"
@@ -1634,11 +1954,11 @@ class VMWareHandler(SourceBase):
 
         # get status
         status = "offline"
-        if get_string_or_none(grab(obj, "summary.runtime.connectionState")) == "connected":
+        if get_string_or_none(self.get_prop(obj, props, "summary.runtime.connectionState")) == "connected":
             status = "active"
 
         # prepare identifiers to find asset tag and serial number
-        identifiers = grab(obj, "summary.hardware.otherIdentifyingInfo", fallback=list())
+        identifiers = self.get_prop(obj, props, "summary.hardware.otherIdentifyingInfo", fallback=list())
         identifier_dict = dict()
         for item in identifiers:
             value = grab(item, "identifierValue", fallback="")
@@ -1648,23 +1968,20 @@ class VMWareHandler(SourceBase):
         # try to find serial
         serial = None
 
-        for serial_num_key in ["SerialNumberTag", "ServiceTag", "EnclosureSerialNumberTag"]:
-            if serial_num_key in identifier_dict.keys() and self.settings.collect_hardware_serial is True:
-                log.debug2(f"Found {serial_num_key}: {get_string_or_none(identifier_dict.get(serial_num_key))}")
-                if serial is None:
-                    serial = get_string_or_none(identifier_dict.get(serial_num_key))
+        if self.settings.collect_hardware_serial is True:
+            serial_num_key = next((key for key in host_serial_identifier_keys if key in identifier_dict), None)
+            if serial_num_key is not None:
+                serial = get_string_or_none(identifier_dict.get(serial_num_key))
+                log.debug2("Found %s: %s", serial_num_key, serial)
 
         # add asset tag if desired and present
         asset_tag = None
 
         if self.settings.collect_hardware_asset_tag is True and "AssetTag" in identifier_dict.keys():
 
-            banned_tags = ["Default string", "NA", "N/A", "None", "Null", "oem", "o.e.m",
-                           "to be filled by o.e.m.", "Unknown"]
-
             this_asset_tag = identifier_dict.get("AssetTag")
 
-            if this_asset_tag.lower() not in [x.lower() for x in banned_tags]:
+            if this_asset_tag.lower() not in banned_asset_tags:
                 asset_tag = this_asset_tag
 
         # get host_tenant_relation
@@ -1703,16 +2020,21 @@ class VMWareHandler(SourceBase):
             host_data["tags"] = host_tags
 
         # add custom fields if present and configured
-        host_custom_fields = self.get_object_custom_fields(obj)
+        host_custom_fields = self.get_object_custom_fields(obj, props)
         if len(host_custom_fields) > 0:
             host_data["custom_fields"] = host_custom_fields
 
         if self.settings.skip_host_nics is True:
             return
 
+        # map of pnic key to the switches this pnic is assigned to, used to look up
+        # switch data directly in the physical interface loop instead of scanning
+        # all virtual and proxy switches for every pNIC
+        pnic_key_to_switches = dict()
+
         # iterate over hosts virtual switches, needed to enrich data on physical interfaces
         self.network_data["vswitch"][name] = dict()
-        for vswitch in grab(obj, "config.network.vswitch", fallback=list()):
+        for vswitch in self.get_prop(obj, props, "config.network.vswitch", fallback=list()):
 
             vswitch_name = unquote(grab(vswitch, "name"))
 
@@ -1720,17 +2042,23 @@ class VMWareHandler(SourceBase):
 
             if vswitch_name is not None:
 
-                log.debug2(f"Found host vSwitch {vswitch_name}")
+                log.debug2("Found host vSwitch %s", vswitch_name)
+
+                vswitch_mtu = grab(vswitch, "mtu")
 
                 self.network_data["vswitch"][name][vswitch_name] = {
-                    "mtu": grab(vswitch, "mtu"),
+                    "mtu": vswitch_mtu,
                     "pnics": vswitch_pnics
                 }
 
+                for vswitch_pnic in vswitch_pnics:
+                    pnic_key_to_switches.setdefault(vswitch_pnic, list()).append(
+                        ("vswitch", vswitch_name, vswitch_mtu))
+
         # iterate over hosts proxy switches, needed to enrich data on physical interfaces
         # also stores data on proxy switch configured mtu which is used for VM interfaces
         self.network_data["pswitch"][name] = dict()
-        for pswitch in grab(obj, "config.network.proxySwitch", fallback=list()):
+        for pswitch in self.get_prop(obj, props, "config.network.proxySwitch", fallback=list()):
 
             pswitch_uuid = grab(pswitch, "dvsUuid")
             pswitch_name = unquote(grab(pswitch, "dvsName"))
@@ -1738,34 +2066,40 @@ class VMWareHandler(SourceBase):
 
             if pswitch_uuid is not None:
 
-                log.debug2(f"Found host proxySwitch {pswitch_name}")
+                log.debug2("Found host proxySwitch %s", pswitch_name)
+
+                pswitch_mtu = grab(pswitch, "mtu")
 
                 self.network_data["pswitch"][name][pswitch_uuid] = {
                     "name": pswitch_name,
-                    "mtu": grab(pswitch, "mtu"),
+                    "mtu": pswitch_mtu,
                     "pnics": pswitch_pnics
                 }
 
+                for pswitch_pnic in pswitch_pnics:
+                    pnic_key_to_switches.setdefault(pswitch_pnic, list()).append(
+                        ("pswitch", pswitch_name, pswitch_mtu))
+
         # iterate over hosts port groups, needed to enrich data on physical interfaces
         self.network_data["host_pgroup"][name] = dict()
-        for pgroup in grab(obj, "config.network.portgroup", fallback=list()):
+        for pgroup in self.get_prop(obj, props, "config.network.portgroup", fallback=list()):
 
-            pgroup_name = grab(pgroup, "spec.name")
+            pgroup_name = direct_grab(pgroup, "spec", "name")
 
             if pgroup_name is not None:
 
-                log.debug2(f"Found host portGroup {pgroup_name}")
+                log.debug2("Found host portGroup %s", pgroup_name)
 
-                nic_order = grab(pgroup, "computedPolicy.nicTeaming.nicOrder")
+                nic_order = direct_grab(pgroup, "computedPolicy", "nicTeaming", "nicOrder")
                 pgroup_nics = list()
-                if grab(nic_order, "activeNic") is not None:
+                if getattr(nic_order, "activeNic", None) is not None:
                     pgroup_nics += nic_order.activeNic
-                if grab(nic_order, "standbyNic") is not None:
+                if getattr(nic_order, "standbyNic", None) is not None:
                     pgroup_nics += nic_order.standbyNic
 
                 self.network_data["host_pgroup"][name][pgroup_name] = {
-                    "vlan_id": grab(pgroup, "spec.vlanId"),
-                    "vswitch": unquote(grab(pgroup, "spec.vswitchName")),
+                    "vlan_id": direct_grab(pgroup, "spec", "vlanId"),
+                    "vswitch": unquote(direct_grab(pgroup, "spec", "vswitchName")),
                     "nics": pgroup_nics
                 }
 
@@ -1779,24 +2113,31 @@ class VMWareHandler(SourceBase):
         except Exception:
             pass
 
-        for pnic in grab(obj, "config.network.pnic", fallback=list()):
+        for pnic in self.get_prop(obj, props, "config.network.pnic", fallback=list()):
+
+            pnic_name = getattr(pnic, "device", None)
+            pnic_key = getattr(pnic, "key", None)
 
-            pnic_name = grab(pnic, "device")
-            pnic_key = grab(pnic, "key")
+            log.debug2("Parsing %s: %s", getattr(pnic, "_wsdlName", None), pnic_name)
 
-            log.debug2("Parsing {}: {}".format(grab(pnic, "_wsdlName"), pnic_name))
+            # bind possible link speed/duplex sources to locals once,
+            # in order of preference: current link, configured link, first valid link
+            pnic_link = getattr(pnic, "linkSpeed", None)
+            pnic_spec_link = getattr(getattr(pnic, "spec", None), "linkSpeed", None)
+            pnic_valid_links = getattr(pnic, "validLinkSpecification", None) or list()
+            pnic_first_valid_link = pnic_valid_links[0] if len(pnic_valid_links) > 0 else None
 
-            pnic_link_speed = grab(pnic, "linkSpeed.speedMb")
+            pnic_link_speed = getattr(pnic_link, "speedMb", None)
             if pnic_link_speed is None:
-                pnic_link_speed = grab(pnic, "spec.linkSpeed.speedMb")
+                pnic_link_speed = getattr(pnic_spec_link, "speedMb", None)
             if pnic_link_speed is None:
-                pnic_link_speed = grab(pnic, "validLinkSpecification.0.speedMb")
+                pnic_link_speed = getattr(pnic_first_valid_link, "speedMb", None)
 
-            pnic_link_duplex = grab(pnic, "linkSpeed.duplex")
+            pnic_link_duplex = getattr(pnic_link, "duplex", None)
             if pnic_link_duplex is None:
-                pnic_link_duplex = grab(pnic, "spec.linkSpeed.duplex")
+                pnic_link_duplex = getattr(pnic_spec_link, "duplex", None)
             if pnic_link_duplex is None:
-                pnic_link_duplex = grab(pnic, "validLinkSpecification.0.duplex")
+                pnic_link_duplex = getattr(pnic_first_valid_link, "duplex", None)
 
             # determine link speed text
             pnic_description = ""
@@ -1812,21 +2153,13 @@ class VMWareHandler(SourceBase):
 
             pnic_mode = None
 
-            # check virtual switches for interface data
-            for vs_name, vs_data in self.network_data["vswitch"][name].items():
-
-                if pnic_key in vs_data.get("pnics", list()):
-                    pnic_description = f"{pnic_description} ({vs_name})"
-                    pnic_mtu = vs_data.get("mtu")
+            # check virtual and proxy switches for interface data
+            for switch_type, switch_name, switch_mtu in pnic_key_to_switches.get(pnic_key, list()):
 
-            # check proxy switches for interface data
-            for ps_uuid, ps_data in self.network_data["pswitch"][name].items():
-
-                if pnic_key in ps_data.get("pnics", list()):
-                    ps_name = ps_data.get("name")
-                    pnic_description = f"{pnic_description} ({ps_name})"
-                    pnic_mtu = ps_data.get("mtu")
+                pnic_description = f"{pnic_description} ({switch_name})"
+                pnic_mtu = switch_mtu
 
+                if switch_type == "pswitch":
                     pnic_mode = "tagged-all"
 
             # check vlans on this pnic
@@ -1839,16 +2172,17 @@ class VMWareHandler(SourceBase):
                         "vid": pg_data.get("vlan_id")
                     })
 
-            pnic_mac_address = normalize_mac_address(grab(pnic, "mac"))
+            pnic_mac_address = normalize_mac_address(getattr(pnic, "mac", None))
 
             if pnic_hints.get(pnic_name) is not None:
-                pnic_switch_port = grab(pnic_hints.get(pnic_name), 'connectedSwitchPort')
+                pnic_switch_port = getattr(pnic_hints.get(pnic_name), "connectedSwitchPort", None)
                 if pnic_switch_port is not None:
-                    pnic_sp_sys_name = grab(pnic_switch_port, 'systemName')
+                    pnic_sp_sys_name = getattr(pnic_switch_port, "systemName", None)
                     if pnic_sp_sys_name is None:
-                        pnic_sp_sys_name = grab(pnic_switch_port, 'devId')
+                        pnic_sp_sys_name = getattr(pnic_switch_port, "devId", None)
                     if pnic_sp_sys_name is not None:
-                        pnic_description += f" (conn: {pnic_sp_sys_name} - {grab(pnic_switch_port, 'portId')})"
+                        pnic_description += \
+                            f" (conn: {pnic_sp_sys_name} - {getattr(pnic_switch_port, 'portId', None)})"
 
             if self.settings.host_nic_exclude_by_mac_list is not None and \
                     pnic_mac_address in self.settings.host_nic_exclude_by_mac_list:
@@ -1859,7 +2193,7 @@ class VMWareHandler(SourceBase):
                 "name": unquote(pnic_name),
                 "device": None,     # will be set once we found the correct device
                 "mac_address": pnic_mac_address,
-                "enabled": bool(grab(pnic, "linkSpeed")),
+                "enabled": bool(pnic_link),
                 "description": unquote(pnic_description),
                 "type": NetBoxInterfaceType(pnic_link_speed).get_this_netbox_type()
             }
@@ -1915,18 +2249,20 @@ class VMWareHandler(SourceBase):
 
         # now iterate over all virtual interfaces and collect data
         vnic_data_dict = dict()
-        vnic_ips = dict()
-        for vnic in grab(obj, "config.network.vnic", fallback=list()):
+        vnic_ips = defaultdict(list)
+        for vnic in self.get_prop(obj, props, "config.network.vnic", fallback=list()):
 
-            vnic_name = grab(vnic, "device")
+            vnic_name = getattr(vnic, "device", None)
+            vnic_spec = getattr(vnic, "spec", None)
+            vnic_dv_port = getattr(vnic_spec, "distributedVirtualPort", None)
 
-            log.debug2("Parsing {}: {}".format(grab(vnic, "_wsdlName"), vnic_name))
+            log.debug2("Parsing %s: %s", getattr(vnic, "_wsdlName", None), vnic_name)
 
-            vnic_portgroup = grab(vnic, "portgroup")
+            vnic_portgroup = getattr(vnic, "portgroup", None)
             vnic_portgroup_data = self.network_data["host_pgroup"][name].get(vnic_portgroup)
             vnic_portgroup_vlan_id = 0
 
-            vnic_dv_portgroup_key = grab(vnic, "spec.distributedVirtualPort.portgroupKey")
+            vnic_dv_portgroup_key = getattr(vnic_dv_port, "portgroupKey", None)
             vnic_dv_portgroup_data = self.network_data["dpgroup"].get(vnic_dv_portgroup_key)
             vnic_dv_portgroup_data_vlan_ids = list()
 
@@ -1961,9 +2297,9 @@ class VMWareHandler(SourceBase):
                     else:
                         vnic_mode = "tagged"
 
-                vnic_dv_portgroup_dswitch_uuid = grab(vnic, "spec.distributedVirtualPort.switchUuid", fallback="NONE")
-                vnic_vswitch = grab(self.network_data, f"pswitch|{name}|{vnic_dv_portgroup_dswitch_uuid}|name",
-                                    separator="|")
+                vnic_dv_portgroup_dswitch_uuid = getattr(vnic_dv_port, "switchUuid", None) or "NONE"
+                vnic_vswitch = self.network_data["pswitch"].get(name, dict()).get(
+                    vnic_dv_portgroup_dswitch_uuid, dict()).get("name")
 
                 if vnic_vswitch is not None:
                     vnic_description = f"{vnic_description} ({vnic_vswitch}, {vlan_description})"
@@ -1972,9 +2308,9 @@ class VMWareHandler(SourceBase):
             vnic_data = {
                 "name": unquote(vnic_name),
                 "device": None,     # will be set once we found the correct device
-                "mac_address": normalize_mac_address(grab(vnic, "spec.mac")),
+                "mac_address": normalize_mac_address(getattr(vnic_spec, "mac", None)),
                 "enabled": True,    # ESXi vmk interface is enabled by default
-                "mtu": grab(vnic, "spec.mtu"),
+                "mtu": getattr(vnic_spec, "mtu", None),
                 "type": "virtual"
             }
 
@@ -2022,18 +2358,17 @@ class VMWareHandler(SourceBase):
 
             # check if interface has the default route or is described as management interface
             vnic_is_primary = False
+            vnic_description_lower = vnic_description.lower()
             for management_match in self.settings.host_management_interface_match:
-                if management_match in vnic_description.lower():
+                if management_match in vnic_description_lower:
                     vnic_is_primary = True
 
-            if grab(vnic, "spec.ipRouteSpec") is not None:
+            if getattr(vnic_spec, "ipRouteSpec", None) is not None:
 
                 vnic_is_primary = True
 
-            if vnic_ips.get(vnic_name) is None:
-                vnic_ips[vnic_name] = list()
-
-            int_v4 = "{}/{}".format(grab(vnic, "spec.ip.ipAddress"), grab(vnic, "spec.ip.subnetMask"))
+            vnic_ip = getattr(vnic_spec, "ip", None)
+            int_v4 = "{}/{}".format(getattr(vnic_ip, "ipAddress", None), getattr(vnic_ip, "subnetMask", None))
 
             if self.settings.permitted_subnets.permitted(int_v4, interface_name=vnic_name) is True:
                 vnic_ips[vnic_name].append(int_v4)
@@ -2041,9 +2376,10 @@ class VMWareHandler(SourceBase):
                 if vnic_is_primary is True and host_primary_ip4 is None:
                     host_primary_ip4 = int_v4
 
-            for ipv6_entry in grab(vnic, "spec.ip.ipV6Config.ipV6Address", fallback=list()):
+            for ipv6_entry in getattr(getattr(vnic_ip, "ipV6Config", None), "ipV6Address", None) or list():
 
-                int_v6 = "{}/{}".format(grab(ipv6_entry, "ipAddress"), grab(ipv6_entry, "prefixLength"))
+                int_v6 = "{}/{}".format(getattr(ipv6_entry, "ipAddress", None),
+                                        getattr(ipv6_entry, "prefixLength", None))
 
                 if self.settings.permitted_subnets.permitted(int_v6, interface_name=vnic_name) is True:
                     vnic_ips[vnic_name].append(int_v6)
@@ -2061,7 +2397,101 @@ class VMWareHandler(SourceBase):
 
         return
 
-    def add_virtual_machine(self, obj):
+    @staticmethod
+    def _parse_vm_default_gateways(ip_stack):
+        """
+        Parse the guest IP stack routing table and return the default gateway for
+        each IP version. Free of inventory side effects, only reads pyVmomi data.
+
+        Parameters
+        ----------
+        ip_stack: list
+            list of guest IP stack info objects to parse
+
+        Returns
+        -------
+        tuple: of IPv4 and IPv6 default gateway, each None if no default route was found
+        """
+
+        default_gateway_ip4 = None
+        default_gateway_ip6 = None
+
+        for route in grab(ip_stack, "0.ipRouteConfig.ipRoute", fallback=list()):
+
+            # we found a default route
+            if getattr(route, "prefixLength", None) == 0:
+
+                ip_a = _cached_ip_address(getattr(route, "network", None))
+                if ip_a is None:
+                    continue
+
+                gateway_ip_address = _cached_ip_address(direct_grab(route, "gateway", "ipAddress"))
+                if gateway_ip_address is None:
+                    continue
+
+                if ip_a.version == 4:
+                    log.debug2("Found default IPv4 gateway %s", gateway_ip_address)
+                    default_gateway_ip4 = gateway_ip_address
+                elif ip_a.version == 6:
+                    log.debug2("Found default IPv6 gateway %s", gateway_ip_address)
+                    default_gateway_ip6 = gateway_ip_address
+
+        return default_gateway_ip4, default_gateway_ip6
+
+    def _parse_vm_disk_data(self, vm_device):
+        """
+        Parse a VM disk device into a disk data dict suitable for
+        'add_device_vm_to_inventory'. Free of inventory side effects,
+        only reads pyVmomi data.
+
+        Parameters
+        ----------
+        vm_device: vim.vm.device.VirtualDisk
+            disk device to parse
+
+        Returns
+        -------
+        dict: of disk name, size and description
+        """
+
+        vm_device_backing = vm_device.backing
+        while getattr(vm_device_backing, "parent", None) is not None:
+            vm_device_backing = vm_device_backing.parent
+
+        vm_device_description = list()
+        vm_device_disk_mode = direct_grab(vm_device, "backing", "diskMode")
+        if vm_device_disk_mode is not None:
+            vm_device_description.append(
+                str(vm_device_disk_mode).capitalize().replace("_", "-"))
+
+        if direct_grab(vm_device, "backing", "thinProvisioned") is True:
+            vm_device_description.append("ThinProvisioned")
+        else:
+            vm_device_description.append("ThickProvisioned")
+
+        vm_device_file_name = getattr(vm_device_backing, "fileName", None)
+        if vm_device_file_name is not None:
+            vm_device_description.append(vm_device_file_name)
+
+        disk_size_in_kb = direct_grab(vm_device, "capacityInKB", fallback=0)
+        if version.parse(self.inventory.netbox_api_version) < version.parse("4.1.0"):
+            disk_size = int(disk_size_in_kb / 1024 / 1024)
+            if disk_size < 1:
+                vm_device_description.append(f"Size: {int(disk_size_in_kb / 1024)} MB")
+                disk_size = 1
+        # since NetBox 4.1.0 disk size is represented in MB
+        else:
+            disk_size = int(disk_size_in_kb / 1024)
+            if self.settings.vm_disk_and_ram_in_decimal:
+                disk_size = int(disk_size / 1024 * 1000)
+
+        return {
+            "name": direct_grab(vm_device, "deviceInfo", "label"),
+            "size": disk_size,
+            "description": " / ".join(vm_device_description)
+        }
+
+    def add_virtual_machine(self, obj, props=None):
         """
         Parse a vCenter VM  add to NetBox once all data is gathered.
 
@@ -2086,9 +2516,11 @@ class VMWareHandler(SourceBase):
         ----------
         obj: vim.VirtualMachine
             virtual machine object to parse
+        props: dict
+            dict of properties collected for this object
         """
 
-        name = get_string_or_none(grab(obj, "name"))
+        name = get_string_or_none(self.get_prop(obj, props, "name"))
 
         if name is not None and self.settings.strip_vm_domain_name is True:
             name = name.split(".")[0]
@@ -2098,7 +2530,7 @@ class VMWareHandler(SourceBase):
         #
 
         # get VM UUID
-        vm_uuid = grab(obj, "config.instanceUuid")
+        vm_uuid = self.get_prop(obj, props, "config.instanceUuid")
 
         if vm_uuid is None or vm_uuid in self.processed_vm_uuid and obj not in self.objects_to_reevaluate:
             return
@@ -2106,16 +2538,16 @@ class VMWareHandler(SourceBase):
         log.debug(f"Parsing vCenter VM: {name}")
 
         # get VM power state
-        status = "active" if get_string_or_none(grab(obj, "runtime.powerState")) == "poweredOn" else "offline"
+        status = "active" if get_string_or_none(self.get_prop(obj, props, "runtime.powerState")) == "poweredOn" else "offline"
 
         # check if vm is template
-        template = grab(obj, "config.template")
+        template = self.get_prop(obj, props, "config.template")
         if bool(self.settings.skip_vm_templates) is True and template is True:
             log.debug2(f"VM '{name}' is a template. Skipping")
             return
 
         if bool(self.settings.skip_srm_placeholder_vms) is True \
-                and f"{grab(obj, 'config.managedBy.extensionKey')}".startswith("com.vmware.vcDr"):
+                and f"{self.get_prop(obj, props, 'config.managedBy.extensionKey')}".startswith("com.vmware.vcDr"):
             log.debug2(f"VM '{name}' is a SRM placeholder VM. Skipping")
             return
 
@@ -2125,9 +2557,9 @@ class VMWareHandler(SourceBase):
             return
 
         # add to processed VMs
-        self.processed_vm_uuid.append(vm_uuid)
+        self.processed_vm_uuid.add(vm_uuid)
 
-        parent_host = self.get_parent_object_by_class(grab(obj, "runtime.host"), vim.HostSystem)
+        parent_host = self.get_parent_object_by_class(self.get_prop(obj, props, "runtime.host"), vim.HostSystem)
         cluster_object = self.get_parent_object_by_class(parent_host, vim.ClusterComputeResource)
 
         # get single host 'cluster' if VM runs on one
@@ -2154,16 +2586,13 @@ class VMWareHandler(SourceBase):
         cluster_name = grab(nb_cluster_object, "data.name")
         cluster_full_name = f"{group.name}/{cluster_name}"
 
-        if name in self.processed_vm_names.get(cluster_full_name, list()) and obj not in self.objects_to_reevaluate:
+        if name in self.processed_vm_names.get(cluster_full_name, set()) and obj not in self.objects_to_reevaluate:
             log.warning(f"Virtual machine '{name}' for cluster '{cluster_full_name}' already parsed. "
                         "Make sure to use unique VM names. Skipping")
             return
 
         # add vm to processed list
-        if self.processed_vm_names.get(cluster_full_name) is None:
-            self.processed_vm_names[cluster_full_name] = list()
-
-        self.processed_vm_names[cluster_full_name].append(name)
+        self.processed_vm_names.setdefault(cluster_full_name, set()).add(name)
 
         # filter VMs by name
         if self.passes_filter(name, self.settings.vm_include_filter, self.settings.vm_exclude_filter) is False:
@@ -2179,11 +2608,11 @@ class VMWareHandler(SourceBase):
             site_name = self.get_site_name(NBCluster, cluster_full_name)
 
         # first check against vm_platform_relation
-        platform = get_string_or_none(grab(obj, "config.guestFullName"))
-        platform = get_string_or_none(grab(obj, "guest.guestFullName", fallback=platform))
+        platform = get_string_or_none(self.get_prop(obj, props, "config.guestFullName"))
+        platform = get_string_or_none(self.get_prop(obj, props, "guest.guestFullName", fallback=platform))
 
         # extract prettyName from extraConfig exposed by guest tools
-        extra_config = [x.value for x in grab(obj, "config.extraConfig", fallback=[])
+        extra_config = [x.value for x in self.get_prop(obj, props, "config.extraConfig", fallback=[])
                         if x.key == "guestOS.detailed.data"]
         if len(extra_config) > 0:
             pretty_name = [x for x in quoted_split(extra_config[0].replace("' ", "', ")) if x.startswith("prettyName")]
@@ -2193,11 +2622,11 @@ class VMWareHandler(SourceBase):
         if platform is not None:
             platform = self.get_object_relation(platform, "vm_platform_relation", fallback=platform)
 
-        hardware_devices = grab(obj, "config.hardware.device", fallback=list())
+        hardware_devices = self.get_prop(obj, props, "config.hardware.device", fallback=list())
 
         annotation = None
         if self.settings.skip_vm_comments is False:
-            annotation = get_string_or_none(grab(obj, "config.annotation"))
+            annotation = get_string_or_none(self.get_prop(obj, props, "config.annotation"))
 
         # assign vm_tenant_relation
         tenant_name = self.get_object_relation(name, "vm_tenant_relation")
@@ -2218,7 +2647,7 @@ class VMWareHandler(SourceBase):
         vm_tags.extend(vcenter_tags)
 
         # vm memory depending on setting
-        vm_memory = grab(obj, "config.hardware.memoryMB", fallback=0)
+        vm_memory = self.get_prop(obj, props, "config.hardware.memoryMB", fallback=0)
 
         if self.settings.vm_disk_and_ram_in_decimal is True:
             vm_memory = int(vm_memory / 1024 * 1000)
@@ -2228,7 +2657,7 @@ class VMWareHandler(SourceBase):
             "cluster": nb_cluster_object,
             "status": status,
             "memory": vm_memory,
-            "vcpus": grab(obj, "config.hardware.numCPU")
+            "vcpus": self.get_prop(obj, props, "config.hardware.numCPU")
         }
 
         # Add adaption for change in NetBox 3.3.0 VM model
@@ -2241,9 +2670,8 @@ class VMWareHandler(SourceBase):
 
         # Add adaption for added virtual disks in NetBox 3.7.0
         if version.parse(self.inventory.netbox_api_version) < version.parse("3.7.0"):
-            vm_data["disk"] = int(sum([getattr(comp, "capacityInKB", 0) for comp in hardware_devices
-                                       if isinstance(comp, vim.vm.device.VirtualDisk)
-                                       ]) / 1024 / 1024)
+            vm_data["disk"] = sum(getattr(comp, "capacityInKB", 0) for comp in hardware_devices
+                                  if isinstance(comp, vim.vm.device.VirtualDisk)) // (1024 * 1024)
 
         # Add adaptation for the new 'serial' field in NetBox 4.1.0 VM model
         if version.parse(self.inventory.netbox_api_version) >= version.parse("4.1.0"):
@@ -2259,41 +2687,34 @@ class VMWareHandler(SourceBase):
             vm_data["tags"] = vm_tags
 
         # add custom fields if present and configured
-        vm_custom_fields = self.get_object_custom_fields(obj)
+        vm_custom_fields = self.get_object_custom_fields(obj, props)
         if len(vm_custom_fields) > 0:
             vm_data["custom_fields"] = vm_custom_fields
 
         vm_primary_ip4 = None
         vm_primary_ip6 = None
-        vm_default_gateway_ip4 = None
-        vm_default_gateway_ip6 = None
 
         # check vm routing to determine which is the default interface for each IP version
-        for route in grab(obj, "guest.ipStack.0.ipRouteConfig.ipRoute", fallback=list()):
-
-            # we found a default route
-            if grab(route, "prefixLength") == 0:
+        vm_default_gateway_ip4, vm_default_gateway_ip6 = \
+            self._parse_vm_default_gateways(self.get_prop(obj, props, "guest.ipStack"))
 
-                try:
-                    ip_a = ip_address(grab(route, "network"))
-                except ValueError:
-                    continue
+        nic_data = dict()
+        nic_ips = defaultdict(list)
+        disk_data = list()
 
-                try:
-                    gateway_ip_address = ip_address(grab(route, "gateway.ipAddress"))
-                except ValueError:
-                    continue
+        # collect IPv6 addresses over all interfaces while parsing, used to
+        # pick a primary IPv6 if exactly one is present on the whole VM
+        potential_primary_ipv6_list = list()
 
-                if ip_a.version == 4 and gateway_ip_address is not None:
-                    log.debug2(f"Found default IPv4 gateway {gateway_ip_address}")
-                    vm_default_gateway_ip4 = gateway_ip_address
-                elif ip_a.version == 6 and gateway_ip_address is not None:
-                    log.debug2(f"Found default IPv6 gateway {gateway_ip_address}")
-                    vm_default_gateway_ip6 = gateway_ip_address
+        # needed by the device loop and the dummy interface loop below
+        guest_net = self.get_prop(obj, props, "guest.net", fallback=list())
 
-        nic_data = dict()
-        nic_ips = dict()
-        disk_data = list()
+        # index guest NICs by normalized MAC address once instead of
+        # re-normalizing every guest NIC MAC for every VM ethernet device
+        guest_nic_by_mac = dict()
+        for guest_nic in guest_net:
+            guest_nic_by_mac.setdefault(
+                normalize_mac_address(getattr(guest_nic, "macAddress", None)), list()).append(guest_nic)
 
         # track MAC addresses in order add dummy guest interfaces
         processed_interface_macs = list()
@@ -2302,42 +2723,7 @@ class VMWareHandler(SourceBase):
         for vm_device in hardware_devices:
 
             if isinstance(vm_device, vim.vm.device.VirtualDisk):
-
-                vm_device_backing = vm_device.backing
-                while grab(vm_device_backing, "parent") is not None:
-                    vm_device_backing = vm_device_backing.parent
-
-                vm_device_description = list()
-                if grab(vm_device, 'backing.diskMode') is not None:
-                    vm_device_description.append(
-                        str(grab(vm_device, 'backing.diskMode')).capitalize().replace("_", "-"))
-
-                if grab(vm_device, 'backing.thinProvisioned') is True:
-                    vm_device_description.append("ThinProvisioned")
-                else:
-                    vm_device_description.append("ThickProvisioned")
-
-                if grab(vm_device_backing, "fileName") is not None:
-                    vm_device_description.append(grab(vm_device_backing, "fileName"))
-
-                disk_size_in_kb = grab(vm_device, "capacityInKB", fallback=0)
-                if version.parse(self.inventory.netbox_api_version) < version.parse("4.1.0"):
-                    disk_size = int(disk_size_in_kb / 1024 / 1024)
-                    if disk_size < 1:
-                        vm_device_description.append(f"Size: {int(disk_size_in_kb / 1024)} MB")
-                        disk_size = 1
-                # since NetBox 4.1.0 disk size is represented in MB
-                else:
-                    disk_size = int(disk_size_in_kb / 1024)
-                    if self.settings.vm_disk_and_ram_in_decimal:
-                        disk_size = int(disk_size / 1024 * 1000)
-
-                disk_data.append({
-                    "name": grab(vm_device, "deviceInfo.label"),
-                    "size": disk_size,
-                    "description": " / ".join(vm_device_description)
-                })
-
+                disk_data.append(self._parse_vm_disk_data(vm_device))
                 continue
 
             # sample: https://github.com/vmware/pyvmomi-community-samples/blob/master/samples/getvnicinfo.py
@@ -2346,13 +2732,13 @@ class VMWareHandler(SourceBase):
             if not isinstance(vm_device, vim.vm.device.VirtualEthernetCard):
                 continue
 
-            int_mac = normalize_mac_address(grab(vm_device, "macAddress"))
+            int_mac = normalize_mac_address(getattr(vm_device, "macAddress", None))
 
-            device_class = grab(vm_device, "_wsdlName")
+            device_class = getattr(vm_device, "_wsdlName", None)
 
-            log.debug2(f"Parsing device {device_class}: {int_mac}")
+            log.debug2("Parsing device %s: %s", device_class, int_mac)
 
-            device_backing = grab(vm_device, "backing")
+            device_backing = getattr(vm_device, "backing", None)
 
             # set defaults
             int_mtu = None
@@ -2368,16 +2754,14 @@ class VMWareHandler(SourceBase):
             if isinstance(device_backing, vim.vm.device.VirtualEthernetCard.NetworkBackingInfo):
 
                 int_network_name = get_string_or_none(grab(device_backing, "deviceName"))
-                int_host_pgroup = grab(self.network_data, f"host_pgroup|{parent_name}|{int_network_name}",
-                                       separator="|")
+                int_host_pgroup = self.network_data["host_pgroup"].get(parent_name, dict()).get(int_network_name)
 
                 if int_host_pgroup is not None:
                     int_network_vlan_ids = [int_host_pgroup.get("vlan_id")]
                     int_network_vlan_id_ranges = [str(int_host_pgroup.get("vlan_id"))]
 
                     int_vswitch_name = int_host_pgroup.get("vswitch")
-                    int_vswitch_data = grab(self.network_data, f"vswitch|{parent_name}|{int_vswitch_name}",
-                                            separator="|")
+                    int_vswitch_data = self.network_data["vswitch"].get(parent_name, dict()).get(int_vswitch_name)
 
                     if int_vswitch_data is not None:
                         int_mtu = int_vswitch_data.get("mtu")
@@ -2385,26 +2769,28 @@ class VMWareHandler(SourceBase):
             # get info from distributed port group
             else:
 
-                dvs_portgroup_key = grab(device_backing, "port.portgroupKey", fallback="None")
-                int_portgroup_data = grab(self.network_data, f"dpgroup|{dvs_portgroup_key}", separator="|")
+                device_backing_port = getattr(device_backing, "port", None)
+
+                dvs_portgroup_key = getattr(device_backing_port, "portgroupKey", None) or "None"
+                int_portgroup_data = self.network_data["dpgroup"].get(dvs_portgroup_key)
 
                 if int_portgroup_data is not None:
-                    int_network_name = grab(int_portgroup_data, "name")
-                    int_network_vlan_ids = grab(int_portgroup_data, "vlan_ids")
-                    if len(grab(int_portgroup_data, "vlan_id_ranges")) > 0:
-                        int_network_vlan_id_ranges = grab(int_portgroup_data, "vlan_id_ranges")
+                    int_network_name = int_portgroup_data.get("name")
+                    int_network_vlan_ids = int_portgroup_data.get("vlan_ids")
+                    if len(int_portgroup_data.get("vlan_id_ranges")) > 0:
+                        int_network_vlan_id_ranges = int_portgroup_data.get("vlan_id_ranges")
                     else:
                         int_network_vlan_id_ranges = [str(int_network_vlan_ids[0])]
-                    int_network_private = grab(int_portgroup_data, "private")
+                    int_network_private = int_portgroup_data.get("private")
 
-                int_dvswitch_uuid = grab(device_backing, "port.switchUuid")
-                int_dvswitch_data = grab(self.network_data, f"pswitch|{parent_name}|{int_dvswitch_uuid}", separator="|")
+                int_dvswitch_uuid = getattr(device_backing_port, "switchUuid", None)
+                int_dvswitch_data = self.network_data["pswitch"].get(parent_name, dict()).get(int_dvswitch_uuid)
 
                 if int_dvswitch_data is not None:
                     int_mtu = int_dvswitch_data.get("mtu")
 
-            int_connected = grab(vm_device, "connectable.connected", fallback=False)
-            int_label = grab(vm_device, "deviceInfo.label", fallback="")
+            int_connected = direct_grab(vm_device, "connectable", "connected", fallback=False)
+            int_label = direct_grab(vm_device, "deviceInfo", "label", fallback="")
 
             int_name = "vNIC {}".format(int_label.split(" ")[-1])
 
@@ -2431,20 +2817,13 @@ class VMWareHandler(SourceBase):
 
                 int_description = f"{int_description} ({vlan_description})"
 
-            # find corresponding guest NIC and get IP addresses and connected status
-            for guest_nic in grab(obj, "guest.net", fallback=list()):
-
-                # get matching guest NIC
-                if int_mac != normalize_mac_address(grab(guest_nic, "macAddress")):
-                    continue
-
-                int_connected = grab(guest_nic, "connected", fallback=int_connected)
+            # find corresponding guest NICs and get IP addresses and connected status
+            for guest_nic in guest_nic_by_mac.get(int_mac, list()):
 
-                if nic_ips.get(int_full_name) is None:
-                    nic_ips[int_full_name] = list()
+                int_connected = direct_grab(guest_nic, "connected", fallback=int_connected)
 
                 # grab all valid interface IP addresses
-                for int_ip in grab(guest_nic, "ipConfig.ipAddress", fallback=list()):
+                for int_ip in direct_grab(guest_nic, "ipConfig", "ipAddress", fallback=list()):
 
                     int_ip_address = f"{int_ip.ipAddress}/{int_ip.prefixLength}"
 
@@ -2453,16 +2832,25 @@ class VMWareHandler(SourceBase):
 
                     nic_ips[int_full_name].append(int_ip_address)
 
+                    int_ip_interface = _cached_ip_interface(int_ip_address)
+                    if int_ip_interface is None:
+                        continue
+
+                    if int_ip_interface.version == 6:
+                        potential_primary_ipv6_list.append(int_ip_interface)
+
                     # check if primary gateways are in the subnet of this IP address
                     # if it matches IP gets chosen as primary IP
                     if vm_default_gateway_ip4 is not None and \
-                            vm_default_gateway_ip4 in ip_interface(int_ip_address).network and \
+                            int_ip_interface.version == 4 and \
+                            vm_default_gateway_ip4 in int_ip_interface.network and \
                             vm_primary_ip4 is None:
 
                         vm_primary_ip4 = int_ip_address
 
                     if vm_default_gateway_ip6 is not None and \
-                            vm_default_gateway_ip6 in ip_interface(int_ip_address).network and \
+                            int_ip_interface.version == 6 and \
+                            vm_default_gateway_ip6 in int_ip_interface.network and \
                             vm_primary_ip6 is None:
 
                         vm_primary_ip6 = int_ip_address
@@ -2513,37 +2901,37 @@ class VMWareHandler(SourceBase):
 
         # find dummy guest NIC interfaces
         if self.settings.sync_vm_dummy_interfaces is True:
-            for guest_nic in grab(obj, "guest.net", fallback=list()):
-
-                # get matching guest NIC MAC
-                guest_nic_mac = normalize_mac_address(grab(guest_nic, "macAddress"))
+            for guest_nic_mac, guest_nics in guest_nic_by_mac.items():
 
                 # skip interfaces of MAC addresses for already known interfaces
                 if guest_nic_mac is None or guest_nic_mac in processed_interface_macs:
                     continue
 
+                guest_nic = guest_nics[0]
+
                 processed_interface_macs.append(guest_nic_mac)
 
                 int_full_name = "vNIC Dummy-{}".format("".join(guest_nic_mac.split(":")[-2:]))
 
-                log.debug2(f"Parsing dummy network device: {guest_nic_mac}")
-
-                if nic_ips.get(int_full_name) is None:
-                    nic_ips[int_full_name] = list()
+                log.debug2("Parsing dummy network device: %s", guest_nic_mac)
 
                 # grab all valid interface IP addresses
-                for int_ip in grab(guest_nic, "ipConfig.ipAddress", fallback=list()):
+                for int_ip in direct_grab(guest_nic, "ipConfig", "ipAddress", fallback=list()):
 
                     int_ip_address = f"{int_ip.ipAddress}/{int_ip.prefixLength}"
 
                     if self.settings.permitted_subnets.permitted(int_ip_address, interface_name=int_full_name) is True:
                         nic_ips[int_full_name].append(int_ip_address)
 
+                        int_ip_interface = _cached_ip_interface(int_ip_address)
+                        if int_ip_interface is not None and int_ip_interface.version == 6:
+                            potential_primary_ipv6_list.append(int_ip_interface)
+
                 vm_nic_data = {
                     "name": int_full_name,
                     "virtual_machine": None,
                     "mac_address": guest_nic_mac,
-                    "enabled": grab(guest_nic, "connected", fallback=False),
+                    "enabled": direct_grab(guest_nic, "connected", fallback=False),
                 }
 
                 if len(nic_ips.get(int_full_name, list())) == 0:
@@ -2553,29 +2941,16 @@ class VMWareHandler(SourceBase):
                 nic_data[int_full_name] = vm_nic_data
 
         # if VM has only one IPv6 on all interfaces, use it as primary IPv6 address
-        if vm_primary_ip6 is None or True:
-            all_ips = [y for xs in nic_ips.values() for y in xs]
-            potential_primary_ipv6_list = list()
-
-            for ip in all_ips:
-                # noinspection PyBroadException
-                try:
-                    ip_address_object = ip_interface(ip)
-                except Exception:
-                    continue
-
-                if ip_address_object.version == 6:
-                    potential_primary_ipv6_list.append(ip_address_object)
-
-            if len(potential_primary_ipv6_list) == 1:
-                log.debug(f"Found one IPv6 '{potential_primary_ipv6_list[0]}' address on all interfaces of "
-                          f"VM '{name}', using it as primary IPv6.")
-                vm_primary_ip6 = potential_primary_ipv6_list[0]
+        if len(potential_primary_ipv6_list) == 1:
+            log.debug(f"Found one IPv6 '{potential_primary_ipv6_list[0]}' address on all interfaces of "
+                      f"VM '{name}', using it as primary IPv6.")
+            vm_primary_ip6 = potential_primary_ipv6_list[0]
 
         # add VM to inventory
         self.add_device_vm_to_inventory(NBVM, object_data=vm_data, vnic_data=nic_data,
                                         nic_ips=nic_ips, p_ipv4=vm_primary_ip4, p_ipv6=vm_primary_ip6,
-                                        vmware_object=obj, disk_data=disk_data)
+                                        vmware_object=obj, disk_data=disk_data,
+                                        guest_tools_status=self.get_prop(obj, props, "guest.toolsRunningStatus"))
 
         return
 
@@ -2588,22 +2963,28 @@ class VMWareHandler(SourceBase):
         """
 
         # add source identification tag
-        self.inventory.add_update_object(NBTag, data={
+        source_tag_data = {
             "name": self.source_tag,
             "description": f"Marks objects synced from vCenter '{self.name}' "
                            f"({self.settings.host_fqdn}) to this NetBox Instance."
-        })
+        }
+        source_tag_object = self.inventory.get_by_data(NBTag, data={"name": self.source_tag})
+
+        if source_tag_object is None or source_tag_object.data_matches(source_tag_data) is False:
+            self.inventory.add_update_object(NBTag, data=source_tag_data)
 
         # update virtual site if present
         this_site_object = self.inventory.get_by_data(NBSite, data={"name": self.site_name})
 
         if this_site_object is not None:
-            this_site_object.update(data={
+            site_data = {
                 "name": self.site_name,
                 "comments": f"A default virtual site created to house objects "
                             "that have been synced from this vCenter instance "
                             "and have no predefined site assigned."
-            })
+            }
+            if this_site_object.data_matches(site_data) is False:
+                this_site_object.update(data=site_data)
 
         server_role_object = self.inventory.get_by_data(NBDeviceRole, data={"name": "Server"})
 
@@ -2612,6 +2993,7 @@ class VMWareHandler(SourceBase):
             if server_role_object.is_new is True:
                 role_data["color"] = "9e9e9e"
 
-            server_role_object.update(data=role_data)
+            if server_role_object.data_matches(role_data) is False:
+                server_role_object.update(data=role_data)
 
 # EOF